@@ -1,13 +1,22 @@
 import bisect
 import hashlib
 import hmac
-import itertools
 import os
-from typing import AnyStr, List, Sequence, TypeVar, Union
+import threading
+from typing import AnyStr, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, TypeVar, Union
 import unicodedata
 
+from witnet.util.pool import chunked, pool_map, pool_processes
+
 _T = TypeVar("_T")
 PBKDF2_ROUNDS = 2048
+RADIX = 2048
+
+# Batches of at least this many phrases are stretched across a process pool by `Mnemonic.to_seed_many`
+SEED_POOL_THRESHOLD = 16
+
+# Number of phrases stretched by a worker per task (PBKDF2 takes a few milliseconds per phrase)
+SEED_CHUNK_SIZE = 8
 
 
 class ConfigurationError(Exception):
@@ -42,15 +51,58 @@ def b58encode(v: bytes) -> str:
     return string
 
 
+class Wordlist(NamedTuple):
+    language: str
+    words: List[str]
+    index: Dict[str, int]  # word -> position in `words`
+    sorted_words: List[str]  # for prefix lookups with bisect, not every wordlist is in code point order
+
+
+# Wordlists read so far and the word -> languages index, shared by every Mnemonic of the process
+_wordlists: Dict[str, Wordlist] = {}
+_languages: List[str] = []
+_language_index: Dict[str, Tuple[str, ...]] = {}
+_registry_lock = threading.Lock()
+
+
+def get_wordlist(language: str) -> Wordlist:
+    """The wordlist of a language, read from disk the first time it is asked for"""
+    wordlist = _wordlists.get(language)
+    if wordlist is None:
+        with _registry_lock:
+            wordlist = _wordlists.get(language)
+            if wordlist is None:
+                with open(os.path.join(Mnemonic._get_directory(), f'{language}.txt'), 'r', encoding='utf-8') as f:
+                    words = [w.strip() for w in f.readlines()]
+                if len(words) != RADIX:
+                    raise ConfigurationError(
+                        f'Word list should contain {RADIX} words, but it contains {len(words)} words.'
+                    )
+                wordlist = _wordlists[language] = Wordlist(language, words, {w: i for i, w in enumerate(words)},
+                                                                sorted(words))
+    return wordlist
+
+
+def language_index() -> Dict[str, Tuple[str, ...]]:
+    """Every word of every wordlist -> the languages that contain it, built once"""
+    if not _language_index:
+        index = {}
+        for language in Mnemonic.list_languages():
+            for word in get_wordlist(language).words:
+                index[word] = index.get(word, ()) + (language,)
+        with _registry_lock:
+            _language_index.update(index)
+    return _language_index
+
+
 class Mnemonic(object):
     def __init__(self, language: str):
-        self.radix = 2048
-        with open(f'{self._get_directory()}/{language}.txt', 'r', encoding='utf-8') as f:
-            self.wordlist = [w.strip() for w in f.readlines()]
-        if len(self.wordlist) != self.radix:
-            raise ConfigurationError(
-                f'Word list should contain {self.radix} words, but it contains {len(self.wordlist)} words.'
-            )
+        self.radix = RADIX
+        self.language = language
+        wordlist = get_wordlist(language)
+        self.wordlist = wordlist.words
+        self.index = wordlist.index
+        self.sorted_words = wordlist.sorted_words
 
     @staticmethod
     def _get_directory() -> str:
@@ -58,7 +110,11 @@ class Mnemonic(object):
 
     @classmethod
     def list_languages(cls) -> List[str]:
-        return [f.split('.')[0] for f in os.listdir(cls._get_directory()) if f.endswith('.txt')]
+        if not _languages:
+            languages = [f.split('.')[0] for f in os.listdir(cls._get_directory()) if f.endswith('.txt')]
+            with _registry_lock:
+                _languages[:] = languages
+        return list(_languages)
 
     @staticmethod
     def normalize_string(txt: AnyStr) -> str:
@@ -74,15 +130,15 @@ class Mnemonic(object):
     @classmethod
     def detect_language(cls, code: str) -> str:
         code = cls.normalize_string(code)
-        first = code.split(" ")[0]
-        languages = cls.list_languages()
-
+        words = code.split(" ")
+        languages = language_index().get(words[0])
+        if not languages:
+            raise ConfigurationError("Language not detected")
+        # a few words are shared between wordlists (e.g. english and french), prefer one that has all of them
         for lang in languages:
-            mnemo = cls(lang)
-            if first in mnemo.wordlist:
+            if all(word in _wordlists[lang].index for word in words[1:]):
                 return lang
-
-        raise ConfigurationError("Language not detected")
+        return languages[0]
 
     def generate(self, word_count: int = 12) -> str:
         strength = {12: 128, 15: 160, 18: 192, 21: 224, 24: 256}
@@ -92,7 +148,21 @@ class Mnemonic(object):
             )
         return self.to_mnemonic(os.urandom(strength[word_count] // 8))
 
-    # Adapted from <http://tinyurl.com/oxmn476>
+    def _to_int(self, words: List[str]) -> int:
+        """The words as one integer, 11 bits per word, raises LookupError for a word that is not in the list"""
+        value = 0
+        for word in words:
+            ndx = self.index.get(word, -1)
+            if ndx < 0:
+                raise LookupError('Unable to find "%s" in word list.' % word)
+            value = value << 11 | ndx
+        return value
+
+    @staticmethod
+    def _checksum(entropy: bytes) -> int:
+        """The first len(entropy) / 4 bits of the SHA-256 of the entropy (at most 8 bits)"""
+        return hashlib.sha256(entropy).digest()[0] >> (8 - len(entropy) // 4)
+
     def to_entropy(self, words: Union[List[str], str]) -> bytearray:
         if not isinstance(words, list):
             words = words.split(" ")
@@ -100,66 +170,23 @@ class Mnemonic(object):
             raise ValueError(
                 f'Number of words must be one of the following: [12, 15, 18, 21, 24], but it is not ({len(words)}).'
             )
-        # Look up all the words in the list and construct the
-        # concatenation of the original entropy and the checksum.
-        concat_length_bits = len(words) * 11
-        concat_bits = [False] * concat_length_bits
-        wordindex = 0
-        if self.detect_language(" ".join(words)) == "english":
-            use_binary_search = True
-        else:
-            use_binary_search = False
-        for word in words:
-            # Find the words index in the wordlist
-            ndx = (
-                binary_search(self.wordlist, word)
-                if use_binary_search
-                else self.wordlist.index(word)
-            )
-            if ndx < 0:
-                raise LookupError('Unable to find "%s" in word list.' % word)
-            # Set the next 11 bits to the value of the index.
-            for ii in range(11):
-                concat_bits[(wordindex * 11) + ii] = (ndx & (1 << (10 - ii))) != 0
-            wordindex += 1
-        checksum_length_bits = concat_length_bits // 33
-        entropy_length_bits = concat_length_bits - checksum_length_bits
-        # Extract original entropy as bytes.
-        entropy = bytearray(entropy_length_bits // 8)
-        for ii in range(len(entropy)):
-            for jj in range(8):
-                if concat_bits[(ii * 8) + jj]:
-                    entropy[ii] |= 1 << (7 - jj)
-        # Take the digest of the entropy.
-        hash_bytes = hashlib.sha256(entropy).digest()
-        hash_bits = list(
-            itertools.chain.from_iterable(
-                [c & (1 << (7 - i)) != 0 for i in range(8)] for c in hash_bytes
-            )
-        )
-        # Check all the checksum bits.
-        for i in range(checksum_length_bits):
-            if concat_bits[entropy_length_bits + i] != hash_bits[i]:
-                raise ValueError("Failed checksum.")
-        return entropy
+        # The concatenation of the original entropy and the checksum, ENT + ENT / 32 bits
+        value = self._to_int(words)
+        checksum_length_bits = len(words) * 11 // 33
+        entropy = (value >> checksum_length_bits).to_bytes(len(words) * 4 // 3, 'big')
+        if value & ((1 << checksum_length_bits) - 1) != self._checksum(entropy):
+            raise ValueError("Failed checksum.")
+        return bytearray(entropy)
 
     def to_mnemonic(self, data: bytes) -> str:
         if len(data) not in [16, 20, 24, 28, 32]:
             raise ValueError(
                 f'Data length should be one of the following: [16, 20, 24, 28, 32], but it is not ({len(data)}).'
             )
-        h = hashlib.sha256(data).hexdigest()
-        b = (
-                bin(int.from_bytes(data, byteorder='big'))[2:].zfill(len(data) * 8)
-                + bin(int(h, 16))[2:].zfill(256)[: len(data) * 8 // 32]
-        )
-        result = []
-        for i in range(len(b) // 11):
-            idx = int(b[i * 11: (i + 1) * 11], 2)
-            result.append(self.wordlist[idx])
-        if (
-                self.detect_language(' '.join(result)) == 'japanese'
-        ):  # Japanese must be joined by ideographic space.
+        word_count = len(data) * 3 // 4
+        value = int.from_bytes(data, 'big') << (len(data) // 4) | self._checksum(data)
+        result = [self.wordlist[(value >> (11 * i)) & 0x7ff] for i in range(word_count - 1, -1, -1)]
+        if self.language == 'japanese':  # Japanese must be joined by ideographic space.
             result_phrase = u'\u3000'.join(result)
         else:
             result_phrase = " ".join(result)
@@ -171,34 +198,41 @@ class Mnemonic(object):
         if len(mnemonic_list) not in [12, 15, 18, 21, 24]:
             return False
         try:
-            idx = map(
-                lambda x: bin(self.wordlist.index(x))[2:].zfill(11), mnemonic_list
-            )
-            b = "".join(idx)
-        except ValueError:
+            self.to_entropy(mnemonic_list)
+        except (LookupError, ValueError):
             return False
-        l = len(b)  # noqa: E741
-        d = b[: l // 33 * 32]
-        h = b[-l // 33:]
-        nd = int(d, 2).to_bytes(l // 33 * 4, byteorder="big")
-        nh = bin(int(hashlib.sha256(nd).hexdigest(), 16))[2:].zfill(256)[: l // 33]
-        return h == nh
+        return True
 
     def expand_word(self, prefix: str) -> str:
-        if prefix in self.wordlist:
+        if prefix in self.index:
             return prefix
-        else:
-            matches = [word for word in self.wordlist if word.startswith(prefix)]
-            if len(matches) == 1:  # matched exactly one word in the word list
-                return matches[0]
-            else:
-                # exact match not found.
-                # this is not a validation routine, just return the input
-                return prefix
+        # the words starting with the prefix are contiguous in the sorted wordlist
+        words = self.sorted_words
+        pos = bisect.bisect_left(words, prefix)
+        if pos < len(words) and words[pos].startswith(prefix) and \
+                (pos + 1 == len(words) or not words[pos + 1].startswith(prefix)):
+            # matched exactly one word in the word list
+            return words[pos]
+        # exact match not found.
+        # this is not a validation routine, just return the input
+        return prefix
 
     def expand(self, mnemonic: str) -> str:
         return " ".join(map(self.expand_word, mnemonic.split(" ")))
 
+    def expand_many(self, mnemonics: Iterable[str]) -> List[str]:
+        """`expand` for many phrases, every distinct prefix is only looked up once"""
+        expanded = {}
+        result = []
+        for mnemonic in mnemonics:
+            words = []
+            for prefix in mnemonic.split(" "):
+                if prefix not in expanded:
+                    expanded[prefix] = self.expand_word(prefix)
+                words.append(expanded[prefix])
+            result.append(" ".join(words))
+        return result
+
     @classmethod
     def to_seed(cls, mnemonic: str, passphrase: str = "") -> bytes:
         mnemonic = cls.normalize_string(mnemonic)
@@ -211,6 +245,33 @@ class Mnemonic(object):
         )
         return stretched[:64]
 
+    @classmethod
+    def to_seed_many(cls, mnemonics: Iterable[str], passphrases: Optional[Union[str, Iterable[str]]] = None,
+                     processes=None, chunk_size=SEED_CHUNK_SIZE,
+                     pool_threshold=SEED_POOL_THRESHOLD) -> Iterator[Tuple[int, bytes]]:
+        """
+        `to_seed` for many phrases, yielding (position of the phrase, seed) pairs. `passphrases` is a single
+        passphrase for every phrase or one per phrase. Batches of at least `pool_threshold` phrases are split in
+        chunks of `chunk_size` and stretched by a pool of `processes` worker processes (see `pool_processes`), in
+        which case the seeds come out in the order they are completed.
+        """
+        mnemonics = list(mnemonics)
+        if passphrases is None or isinstance(passphrases, (str, bytes)):
+            passphrases = [passphrases or ""] * len(mnemonics)
+        else:
+            passphrases = list(passphrases)
+            assert len(passphrases) == len(mnemonics), 'Expected one passphrase per mnemonic'
+        work = list(zip(range(len(mnemonics)), mnemonics, passphrases))
+
+        processes = pool_processes(processes, len(work), pool_threshold)
+        if processes == 1:
+            yield from _to_seed_chunk(work)
+            return
+
+        tasks = ((chunk,) for chunk in chunked(work, chunk_size))
+        for seeds in pool_map(_to_seed_chunk, tasks, processes, ordered=False):
+            yield from seeds
+
     @staticmethod
     def to_hd_master_key(seed: bytes, testnet: bool = False) -> str:
         if len(seed) != 64:
@@ -237,3 +298,8 @@ class Mnemonic(object):
 
         # Return base58
         return b58encode(xprv)
+
+
+def _to_seed_chunk(work: List[Tuple[int, str, str]]) -> List[Tuple[int, bytes]]:
+    """Worker for `Mnemonic.to_seed_many`"""
+    return [(i, Mnemonic.to_seed(mnemonic, passphrase)) for i, mnemonic, passphrase in work]
@@ -0,0 +1,103 @@
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from witnet.crypto.bip39.mnemonic import Mnemonic
+from witnet.crypto.hd_wallet.extended_private_key import Xprv
+from witnet.crypto.hd_wallet.extended_public_key import Xpub
+from witnet.crypto.secp256k1 import WitPrivateKey, WitPublicKey
+from witnet.util.pool import chunked, pool_map, pool_processes
+from witnet.witnet.address import pubkey_to_address, pubkey_to_pkh
+from witnet.witnet.exceptions import KeyDerivationError
+
+# Ranges with at least this many children are derived across a process pool
+DERIVE_POOL_THRESHOLD = 1024
+
+# Number of children derived by a worker per task
+DERIVE_CHUNK_SIZE = 256
+
+# Account of the addresses derived by `wallets_from_mnemonics`, their paths are <account>/<keychain>/<index>
+WITNET_ACCOUNT_PATH = 'm/3h/4919h/0h'
+
+# Number of children whose public keys are normalised together with a single field inversion
+DERIVE_BATCH_SIZE = 64
+
+
+class DerivedAddress(NamedTuple):
+    index: int
+    public_key: bytes  # compressed
+    pkh: bytes
+    address: str
+
+
+class MnemonicWallet(NamedTuple):
+    phrase_id: int  # position of the phrase in the input
+    master: Xprv
+    addresses: List[DerivedAddress]
+
+
+def derive_range(parent: Union[Xprv, Xpub], start: int, count: int, hardened=False, processes=None,
+                 chunk_size=DERIVE_CHUNK_SIZE, pool_threshold=DERIVE_POOL_THRESHOLD) -> Iterator[DerivedAddress]:
+    """
+    Derive the children start, ..., start + count - 1 of `parent` and yield them in order as `DerivedAddress`
+    tuples. Ranges of at least `pool_threshold` children are split in chunks of `chunk_size` and derived by a pool
+    of `processes` worker processes (see `pool_processes`), results stream out as soon as the first chunks are done.
+    """
+    if hardened and not isinstance(parent, Xprv):
+        raise KeyDerivationError('Cannot derive a hardened key from an extended public key')
+    assert 0 <= start and start + count <= 1 << 31, f'Invalid range: {start}, {count}'
+
+    processes = pool_processes(processes, count, pool_threshold)
+    if processes == 1:
+        yield from _derive_children(parent, start, count, hardened)
+        return
+
+    state = _parent_state(parent)
+    chunks = chunked(range(start, start + count), chunk_size)
+    tasks = ((state, indexes.start, len(indexes), hardened) for indexes in chunks)
+    for results in pool_map(_derive_chunk, tasks, processes):
+        yield from results
+
+
+def wallets_from_mnemonics(mnemonics: Iterable[str], passphrases: Optional[Union[str, Iterable[str]]] = None,
+                           addresses=0, account_path=WITNET_ACCOUNT_PATH, keychain=0,
+                           processes=None) -> Iterator[MnemonicWallet]:
+    """
+    Master key and first `addresses` addresses of every phrase, in the order their seeds are completed. The seeds
+    are stretched in parallel by `Mnemonic.to_seed_many`, which is where nearly all of the time goes.
+    """
+    for phrase_id, seed in Mnemonic.to_seed_many(mnemonics, passphrases, processes=processes):
+        master = Xprv.from_seed(seed)
+        derived = []
+        if addresses:
+            # every master is walked once, caching its levels would only keep the account key around
+            account = master.derive_path(account_path, cache=False)
+            derived = list(derive_range(account / keychain, 0, addresses))
+        yield MnemonicWallet(phrase_id, master, derived)
+
+
+def _parent_state(parent: Union[Xprv, Xpub]) -> Tuple:
+    """Plain, picklable description of an extended key"""
+    key = parent.key.bytes() if isinstance(parent, Xprv) else parent.key.encode(compressed=True)
+    return isinstance(parent, Xprv), key, parent.code, parent.depth, parent.i, parent.parent, parent.path
+
+
+def _from_state(state: Tuple) -> Union[Xprv, Xpub]:
+    private, key, code, depth, i, parent, path = state
+    if private:
+        return Xprv(WitPrivateKey(key), code, depth=depth, i=i, parent=parent, path=path)
+    return Xpub(WitPublicKey.decode(key), code, depth=depth, i=i, parent=parent, path=path)
+
+
+def _derive_chunk(state: Tuple, start: int, count: int, hardened: bool) -> List[DerivedAddress]:
+    """Worker for `derive_range`"""
+    return list(_derive_children(_from_state(state), start, count, hardened))
+
+
+def _derive_children(parent: Union[Xprv, Xpub], start: int, count: int, hardened: bool) -> Iterator[DerivedAddress]:
+    offset = 1 << 31 if hardened else 0
+    for first in range(start, start + count, DERIVE_BATCH_SIZE):
+        indexes = range(first, min(first + DERIVE_BATCH_SIZE, start + count))
+        # `children` computes the public keys of the whole batch together
+        for index, child in zip(indexes, parent.children([index + offset for index in indexes])):
+            public_key = child.public_key()
+            yield DerivedAddress(index, child.public_keydata(), pubkey_to_pkh(public_key),
+                                 pubkey_to_address(public_key))
@@ -1,12 +1,20 @@
+import threading
+from collections import OrderedDict
 from typing import Union
 
 from witnet.crypto.secp256k1 import WitPrivateKey, WitPublicKey
-from witnet.util.transformations import bytes_to_int, bytes_to_hex, sha256, base58
+from witnet.util.transformations import bytes_to_int, bytes_to_hex, hash160, sha256, base58
 
 from witnet.witnet.network import network
 
 KEY = Union[WitPrivateKey, WitPublicKey]
 
+# Number of derived keys kept by `ExtendedKey.derive_path` on each key it is called on, enough for the hardened
+# account levels plus the recently walked address indexes
+DERIVATION_CACHE_SIZE = 1024
+
+_derivation_cache_lock = threading.Lock()
+
 
 class ExtendedKey:
     root_path = NotImplemented
@@ -21,6 +29,12 @@ class ExtendedKey:
         self.i = i
         self.parent = parent
         self.path = path or self.root_path
+        # public key, its compressed encoding and hash160, computed on first use (see `public_key`)
+        self._public_key = None
+        self._public_keydata = None
+        self._id = None
+        # descendants derived by `derive_path` from this key, see `derivation_cache_clear`
+        self._derivation_cache = OrderedDict()
         assert (self.depth == 0 and self.i is None and self.parent == b'\x00\x00\x00\x00' and self.path == self.root_path) or \
                (self.depth != 0 and self.i is not None and self.parent != b'\x00\x00\x00\x00' and self.path != self.root_path), \
             f"Unable to determine if root path (depth={self.depth}, i={self.i}, path={self.path}, parent={bytes_to_hex(self.parent)})"
@@ -28,6 +42,55 @@ class ExtendedKey:
     def child(self, i):
         raise NotImplementedError
 
+    def children(self, indices) -> list:
+        """`child` for many indexes"""
+        return [self.child(i) for i in indices]
+
+    def derive_path(self, path: str, cache=True) -> 'ExtendedKey':
+        """
+        Derive a path like "m/3h/4919h/0h/0/5" (from a master key) or "0/5" (relative to this key). The keys of every
+        level are kept in a bounded LRU cache on this key, so sibling paths only pay for the levels that differ.
+        The cache lives and dies with this key and is never shared with other keys, derived private keys are not
+        kept around any longer than the key they came from; `/` and `//` are not cached, nor is a path derived
+        with `cache=False` (for keys that are only walked once).
+        """
+        levels = path.strip().strip('/').split('/')
+        if levels[0] in ('m', 'M'):
+            assert self.is_master() and levels[0] == self.root_path, \
+                f'Path {path} does not start at this key ({self.path})'
+            levels = levels[1:]
+        indexes = []
+        for level in levels:
+            hardened = level[-1:] in ("h", "H", "'")
+            index = int(level[:-1] if hardened else level)
+            assert 0 <= index < 1 << 31, f'Invalid index in path {path}: {level}'
+            indexes.append(index + (1 << 31 if hardened else 0))
+
+        key = self
+        if not cache:
+            for index in indexes:
+                key = key.child(index)
+            return key
+        for depth in range(len(indexes)):
+            prefix = tuple(indexes[:depth + 1])
+            with _derivation_cache_lock:
+                child = self._derivation_cache.get(prefix)
+                if child is not None:
+                    self._derivation_cache.move_to_end(prefix)
+            if child is None:
+                child = key.child(prefix[-1])
+                with _derivation_cache_lock:
+                    self._derivation_cache[prefix] = child
+                    if len(self._derivation_cache) > DERIVATION_CACHE_SIZE:
+                        self._derivation_cache.popitem(last=False)
+            key = child
+        return key
+
+    def derivation_cache_clear(self):
+        """Drop the keys cached by `derive_path`"""
+        with _derivation_cache_lock:
+            self._derivation_cache.clear()
+
     def is_master(self):
         return self.depth == 0 and self.i is None and self.parent == b'\x00\x00\x00\x00' and self.path == self.root_path
 
@@ -47,9 +110,25 @@ class ExtendedKey:
             raise TypeError
         return self.child(other + 2 ** 31)
 
-    def id(self):
+    def _compute_public_key(self) -> WitPublicKey:
         raise NotImplementedError
 
+    def public_key(self) -> WitPublicKey:
+        if self._public_key is None:
+            self._public_key = self._compute_public_key()
+        return self._public_key
+
+    def public_keydata(self) -> bytes:
+        """Compressed public key, the HMAC input of non-hardened children"""
+        if self._public_keydata is None:
+            self._public_keydata = self.public_key().encode(compressed=True)
+        return self._public_keydata
+
+    def id(self) -> bytes:
+        if self._id is None:
+            self._id = hash160(self.public_keydata())
+        return self._id
+
     def fingerprint(self):
         return self.id()[:4]
 
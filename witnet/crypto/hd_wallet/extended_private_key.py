@@ -1,13 +1,14 @@
 import hashlib
 import hmac
-from typing import Union
+from typing import List, Union
 
 from witnet.crypto.bip39.mnemonic import Mnemonic
 from witnet.crypto.hd_wallet.extended_key import ExtendedKey
 from witnet.crypto.hd_wallet.extended_public_key import Xpub
-from witnet.crypto.secp256k1 import CURVE, WitPrivateKey
-from witnet.util.transformations import int_to_bytes, bytes_to_int, hash160, hex_to_bytes, bytes_to_hex
-from witnet.util.transformations.bech32 import bech32_encode_master_key, bech32_decode_address
+from witnet.crypto.secp256k1 import CURVE, WitPrivateKey, WitPublicKey, get_backend
+from witnet.crypto.secp256k1.secp256k1 import Point
+from witnet.util.transformations import int_to_bytes, bytes_to_int, hex_to_bytes, bytes_to_hex
+from witnet.util.bech32 import bech32_encode_master_key, bech32_decode_address
 from witnet.witnet.exceptions import KeyDerivationError
 
 
@@ -19,13 +20,10 @@ class Xprv(ExtendedKey):
         if hardened:
             I = hmac.new(key=self.code, msg=self.keydata() + int_to_bytes(i).rjust(4, b'\x00'),
                          digestmod=hashlib.sha512).digest()
-            tmp = int_to_bytes(i).rjust(4, b'\x00')
 
         else:
-            I = hmac.new(key=self.code,
-                         msg=self.key.to_public().encode(compressed=True) + int_to_bytes(i).rjust(4, b'\x00'),
+            I = hmac.new(key=self.code, msg=self.public_keydata() + int_to_bytes(i).rjust(4, b'\x00'),
                          digestmod=hashlib.sha512).digest()
-            tmp = self.key.to_public().encode(compressed=True) + int_to_bytes(i).rjust(4, b'\x00')
 
         I_L, I_R = bytes_to_int(I[:32]), I[32:]
         key = (I_L + self.key.int()) % CURVE.order
@@ -39,16 +37,26 @@ class Xprv(ExtendedKey):
 
         return Xprv(WitPrivateKey.from_int(key), ret_code, depth=self.depth + 1, i=i, parent=self.fingerprint(), path=path)
 
+    def children(self, indices) -> List['Xprv']:
+        """`child` for many indexes, with the public keys of the children computed together (`public_key_many`)"""
+        children = [self.child(i) for i in indices]
+        points = get_backend().public_key_many([child.key.int() for child in children])
+        for child, point in zip(children, points):
+            child._public_key = WitPublicKey(Point(*point, validate=False))
+        return children
+
     def to_xpub(self) -> 'Xpub':
-        return Xpub(self.key.to_public(), self.code, depth=self.depth, i=self.i, parent=self.parent,
+        xpub = Xpub(self.public_key(), self.code, depth=self.depth, i=self.i, parent=self.parent,
                     path=self.path.replace('m', 'M'))
+        xpub._public_keydata, xpub._id = self._public_keydata, self._id
+        return xpub
 
     def to_child_xpub(self, i: int) -> 'Xpub':
         # return self.child(i).to_xpub()  # works always
         return self.to_xpub().child(i)  # works only for non-hardened child keys
 
-    def id(self):
-        return hash160(self.key.to_public().encode(compressed=True))
+    def _compute_public_key(self):
+        return self.key.to_public()
 
     def keydata(self):
         return self.key.bytes().rjust(33, b'\x00')
@@ -84,12 +92,12 @@ class Xprv(ExtendedKey):
         return cls.from_seed(seed)
 
     def address(self):
-        return self.key.to_public().to_address(compressed=True)
+        return self.public_key().to_address(compressed=True)
 
     @classmethod
     def from_xprv(cls, xprv: str) -> 'Xprv':
         ...
-        from witnet.util.transformations.bech32 import bech32_decode_address
+        from witnet.util.bech32 import bech32_decode_address
 
         bech = bech32_decode_address(xprv)
         idx = 0
@@ -1,9 +1,11 @@
 import hashlib
 import hmac
+from typing import List
 
 from witnet.crypto.hd_wallet.extended_key import ExtendedKey
-from witnet.crypto.secp256k1 import WitPrivateKey, WitPublicKey
-from witnet.util.transformations import bytes_to_hex, int_to_bytes, hash160
+from witnet.crypto.secp256k1 import CURVE, WitPublicKey, get_backend
+from witnet.crypto.secp256k1.secp256k1 import Point
+from witnet.util.transformations import bytes_to_int
 from witnet.witnet.exceptions import KeyDerivationError
 
 
@@ -16,24 +18,50 @@ class Xpub(ExtendedKey):
         if hardened:
             raise KeyDerivationError('Cannot derive a hardened key from an extended public key')
 
-        I = hmac.new(key=self.code, msg=self.keydata() + int_to_bytes(i).rjust(4, b'\x00'),
-                     digestmod=hashlib.sha512).digest()
-        tmp = bytes_to_hex(self.keydata() + int_to_bytes(i).rjust(4, b'\x00'))
+        I = hmac.new(key=self.code, msg=self.keydata() + i.to_bytes(4, 'big'), digestmod=hashlib.sha512).digest()
+        I_L, I_R = bytes_to_int(I[:32]), I[32:]
+        if I_L >= CURVE.order:
+            return self.child(i + 1)
 
-        I_L, I_R = I[:32], I[32:]
-
-        key = WitPrivateKey(I_L).to_public().point + self.key.point
+        key = get_backend().tweak_add(self.key.point, I_L)
+        if key is None:
+            return self.child(i + 1)
         ret_code = I_R
         path = self.path + f'/{i}'
 
-        # TODO add point at infinity check
-        return Xpub(WitPublicKey(key), ret_code, depth=self.depth + 1, i=i, parent=self.fingerprint(), path=path)
+        return Xpub(WitPublicKey(Point(*key, validate=False)), ret_code, depth=self.depth + 1, i=i,
+                    parent=self.fingerprint(), path=path)
+
+    def children(self, indices) -> List['Xpub']:
+        """
+        Non-hardened children of this key, with the tweaked points kept in Jacobian form and normalised together
+        (`Backend.tweak_add_many`) instead of paying one field inversion per child
+        """
+        indices = list(indices)
+        if any(i >= 1 << 31 for i in indices):
+            raise KeyDerivationError('Cannot derive a hardened key from an extended public key')
+
+        keydata, fingerprint = self.keydata(), self.fingerprint()
+        digests = [hmac.new(key=self.code, msg=keydata + i.to_bytes(4, 'big'), digestmod=hashlib.sha512).digest()
+                   for i in indices]
+        tweaks = [bytes_to_int(I[:32]) for I in digests]
+        points = get_backend().tweak_add_many(self.key.point, [t if t < CURVE.order else 0 for t in tweaks])
+
+        children = []
+        for i, I, tweak, point in zip(indices, digests, tweaks, points):
+            if tweak >= CURVE.order or point is None:
+                # invalid child, `child` moves on to the next index
+                children.append(self.child(i))
+                continue
+            children.append(Xpub(WitPublicKey(Point(*point, validate=False)), I[32:], depth=self.depth + 1, i=i,
+                                 parent=fingerprint, path=self.path + f'/{i}'))
+        return children
 
-    def id(self):
-        return hash160(self.key.encode(compressed=True))
+    def _compute_public_key(self):
+        return self.key
 
     def keydata(self):
-        return self.key.encode(compressed=True)
+        return self.public_keydata()
 
     def __repr__(self):
         return f"{self.__class__.__name__}(path={self.path}, key={self.key.hex(compressed=True)})"
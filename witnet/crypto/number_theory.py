@@ -1,11 +1,16 @@
 import random
 import secrets
+from functools import lru_cache
 from math import gcd
-from typing import Tuple
+from typing import List, Tuple
 
 import sys
 
-sys.setrecursionlimit(1_000_000)
+# pow(b, -1, n) computes modular inverses natively since Python 3.8
+NATIVE_INVERSE = sys.version_info >= (3, 8)
+
+# Moduli known to be prime, such as curve field primes and orders, see `register_prime`
+KNOWN_PRIMES = set()
 
 
 def miller_rabin(n, runs=40):
@@ -38,6 +43,17 @@ def miller_rabin(n, runs=40):
         return True
 
 
+def register_prime(*primes):
+    """Record moduli that are known to be prime so `is_prime` does not have to test them"""
+    KNOWN_PRIMES.update(primes)
+
+
+@lru_cache(maxsize=256)
+def is_prime(n) -> bool:
+    """Memoised primality check, registered primes cost a set lookup and others one Miller-Rabin test each"""
+    return n in KNOWN_PRIMES or miller_rabin(n)
+
+
 def random_prime(bits):
     while True:
         n = secrets.randbits(bits)
@@ -73,20 +89,71 @@ def egcd(b: int, n: int) -> Tuple[int, int, int]:
         return g, y - n_div_b * x, x
 
 
-def mulinv(b, n, algo=xgcd):
-    """An application of extended GCD algorithm to finding modular inverses"""
-    g, x, _ = algo(b, n)
+def mulinv(b, n, algo=None):
+    """
+    Modular inverse of b mod n. Uses the interpreter's pow(b, -1, n) when available (Python 3.8+),
+    otherwise, or when an extended GCD `algo` is given, an application of that algorithm
+    """
+    if algo is None and NATIVE_INVERSE:
+        try:
+            return pow(b, -1, n)
+        except ValueError:
+            raise AssertionError('Numbers must be coprimes') from None
+    g, x, _ = (algo or xgcd)(b, n)
     assert g == 1, 'Numbers must be coprimes'
     return x % n
 
 
+def batch_mulinv(values: List[int], n: int) -> List[int]:
+    """
+    Inverses of all values mod n with a single modular inversion (Montgomery's trick): invert the product of all
+    values, then peel each inverse off with two multiplications. Every value must be invertible.
+    """
+    prefix = []
+    acc = 1
+    for value in values:
+        prefix.append(acc)
+        acc = acc * value % n
+    inv = mulinv(acc, n)
+    result = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        result[i] = inv * prefix[i] % n
+        inv = inv * values[i] % n
+    return result
+
+
 def legendre(a, p):
     """https://en.wikipedia.org/wiki/Legendre_symbol"""
-    assert miller_rabin(p), f"{p} is not a prime"
+    assert is_prime(p), f"{p} is not a prime"
     mod = pow(a, (p - 1) // 2, p)
     return -1 if mod == p - 1 else mod
 
 
+@lru_cache(maxsize=64)
+def tonelli_shanks_parameters(p) -> Tuple[int, int, int]:
+    """
+    The parts of Tonelli-Shanks that only depend on the modulus: (s, e, g) with p - 1 = s * 2^e for an odd s,
+    and g = n^s for some 'n' with a legendre symbol n|p = -1
+    """
+    # Partition p-1 to s * 2^e for an odd s (i.e.
+    # reduce all the powers of 2 from p-1)
+    #
+    s = p - 1
+    e = 0
+    while s % 2 == 0:
+        s //= 2
+        e += 1
+
+    # Find some 'n' with a legendre symbol n|p = -1.
+    # Shouldn't take long.
+    #
+    n = 2
+    while legendre(n, p) != -1:
+        n += 1
+
+    return s, e, pow(n, s, p)
+
+
 def modsqrt(a, p):
     """
         https://eli.thegreenplace.net/2009/03/07/computing-modular-square-roots-in-python
@@ -109,21 +176,7 @@ def modsqrt(a, p):
     elif p % 4 == 3:
         return pow(a, (p + 1) // 4, p)
 
-    # Partition p-1 to s * 2^e for an odd s (i.e.
-    # reduce all the powers of 2 from p-1)
-    #
-    s = p - 1
-    e = 0
-    while s % 2 == 0:
-        s //= 2
-        e += 1
-
-    # Find some 'n' with a legendre symbol n|p = -1.
-    # Shouldn't take long.
-    #
-    n = 2
-    while legendre(n, p) != -1:
-        n += 1
+    s, e, g = tonelli_shanks_parameters(p)
 
     # Here be dragons!
     # Read the paper "Square roots from 1; 24, 51,
@@ -142,7 +195,6 @@ def modsqrt(a, p):
     #
     x = pow(a, (s + 1) // 2, p)
     b = pow(a, s, p)
-    g = pow(n, s, p)
     r = e
 
     while True:
@@ -1,3 +1,5 @@
 from witnet.crypto.secp256k1.secp256k1 import CURVE, Curve, WitPublicKey, WitPrivateKey, Signature
+from witnet.crypto.secp256k1.secp256k1 import recover_public_key, verify_batch
 
 
+from witnet.crypto.secp256k1.backends import available_backends, get_backend, set_backend
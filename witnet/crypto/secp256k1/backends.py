@@ -0,0 +1,288 @@
+import os
+import secrets
+from typing import Iterator, List, Optional, Tuple
+
+from witnet.util.transformations import bytes_to_int
+
+# Environment variable used to pick a backend: 'python', 'python-ladder', 'coincurve', 'cryptography' or 'auto'
+BACKEND_ENV = 'WITNET_SECP256K1_BACKEND'
+
+# Preference order when the backend is 'auto'
+AUTO_ORDER = ['coincurve', 'cryptography', 'python']
+
+# Native libraries sign and verify 32 byte digests, anything else goes through the pure-Python code
+DIGEST_SIZE = 32
+
+
+class Backend:
+    """
+    Curve primitives behind WitPrivateKey, WitPublicKey and Signature. Secrets and signature values are plain
+    integers, hashes are bytes and public keys are anything with `x` and `y` attributes.
+
+    `sign` takes the RFC 6979 nonces of the key when deterministic signatures are wanted, native libraries may
+    derive the same nonces themselves instead of consuming them. Without nonces the backend picks its own.
+    It returns (r, s, recid) where recid is the recovery id of (r, s) as returned, before any low s normalisation,
+    or None when the backend cannot get it for free; signing must never pay for trial recoveries.
+    """
+    name = NotImplemented
+
+    def public_key(self, secret: int) -> Tuple[int, int]:
+        raise NotImplementedError
+
+    def public_key_many(self, scalars: List[int]) -> List[Tuple[int, int]]:
+        return [self.public_key(secret) for secret in scalars]
+
+    def sign(self, secret: int, _hash: bytes, nonces: Optional[Iterator[int]] = None) -> Tuple[int, int, Optional[int]]:
+        raise NotImplementedError
+
+    def verify(self, _hash: bytes, r: int, s: int, point) -> bool:
+        raise NotImplementedError
+
+    def verify_many(self, rows) -> List[bool]:
+        """`verify` for a list of (hash, r, s, point) rows"""
+        return [self.verify(*row) for row in rows]
+
+    def recover(self, _hash: bytes, r: int, s: int, recid: int) -> Tuple[int, int]:
+        raise NotImplementedError
+
+    def tweak_add(self, point, tweak: int) -> Optional[Tuple[int, int]]:
+        """point + G * tweak for a public tweak (BIP32 public derivation), None for the point at infinity"""
+        from witnet.crypto.secp256k1.secp256k1 import CURVE
+
+        # the tweak is not secret, so it can always use the variable-time generator table
+        result = CURVE.point_add(CURVE.generator * tweak, point)
+        return None if result is None else (result.x, result.y)
+
+    def tweak_add_many(self, point, tweaks: List[int]) -> List[Optional[Tuple[int, int]]]:
+        """`tweak_add` for many tweaks of the same point, with a single batched inversion"""
+        from witnet.crypto.secp256k1.secp256k1 import CURVE
+
+        return [None if p is None else (p.x, p.y) for p in CURVE.generator_mul_many(tweaks, point)]
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}()"
+
+
+class PythonBackend(Backend):
+    name = 'python'
+
+    def secret_mul(self, secret: int):
+        """G * secret, for scalars that must stay secret (private keys and nonces)"""
+        from witnet.crypto.secp256k1.secp256k1 import CURVE
+
+        return CURVE.generator * secret
+
+    def public_key(self, secret):
+        point = self.secret_mul(secret)
+        return point.x, point.y
+
+    def public_key_many(self, scalars):
+        from witnet.crypto.secp256k1.secp256k1 import CURVE
+
+        return [(p.x, p.y) for p in CURVE.generator_mul_many(scalars)]
+
+    def sign(self, secret, _hash, nonces=None):
+        from witnet.crypto import number_theory as nt
+        from witnet.crypto.secp256k1.secp256k1 import N
+
+        if nonces is None:
+            nonces = iter(lambda: 1 + secrets.randbelow(N - 1), None)
+        e = bytes_to_int(_hash)
+        for k in nonces:
+            point = self.secret_mul(k)
+            r = point.x % N
+            if r == 0:
+                continue
+
+            inv_k = nt.mulinv(k, N)
+            s = (inv_k * (e + r * secret)) % N
+            if s != 0:
+                return r, s, (point.y & 1) | (2 if point.x >= N else 0)
+
+    def verify(self, _hash, r, s, point):
+        from witnet.crypto import number_theory as nt
+        from witnet.crypto.secp256k1.secp256k1 import N
+
+        return self._verify(_hash, r, nt.mulinv(s, N), point)
+
+    def verify_many(self, rows):
+        from witnet.crypto import number_theory as nt
+        from witnet.crypto.secp256k1.secp256k1 import N
+
+        inverses = nt.batch_mulinv([s for _, _, s, _ in rows], N)
+        return [self._verify(_hash, r, w, point) for (_hash, r, _, point), w in zip(rows, inverses)]
+
+    @staticmethod
+    def _verify(_hash, r, w, point):
+        """Verification with w = s⁻¹ mod N already computed"""
+        from witnet.crypto.secp256k1.secp256k1 import CURVE, N
+
+        e = bytes_to_int(_hash)
+        u1 = (e * w) % N
+        u2 = (r * w) % N
+        result = CURVE.multi_mul([(CURVE.generator, u1), (point, u2)])
+        return result is not None and r % N == result.x % N
+
+    def recover(self, _hash, r, s, recid):
+        from witnet.crypto import number_theory as nt
+        from witnet.crypto.secp256k1.secp256k1 import CURVE, N, P, decode_point_uncached
+
+        x = r + (recid >> 1) * N
+        assert x < P, 'Invalid recovery id'
+        nonce_point = decode_point_uncached(bytes([2 | (recid & 1)]) + x.to_bytes(32, 'big'))
+        e = bytes_to_int(_hash)
+        r_inv = nt.mulinv(r, N)
+        result = CURVE.multi_mul([(nonce_point, s * r_inv), (CURVE.generator, -e * r_inv)])
+        assert result is not None, 'Signature does not recover to a valid public key'
+        return result.x, result.y
+
+
+class LadderBackend(PythonBackend):
+    """
+    Pure-Python backend multiplying secret scalars with a fixed-iteration Montgomery ladder instead of the
+    generator table, for deployments where key dependent timing matters more than throughput
+    """
+    name = 'python-ladder'
+
+    def secret_mul(self, secret):
+        from witnet.crypto.secp256k1.secp256k1 import CURVE
+
+        return CURVE.ladder_mul(CURVE.generator, secret)
+
+    def public_key_many(self, scalars):
+        # one ladder per secret, the batched path goes through the generator table
+        return Backend.public_key_many(self, scalars)
+
+
+class CoincurveBackend(Backend):
+    """libsecp256k1 through https://github.com/ofek/coincurve"""
+    name = 'coincurve'
+
+    def __init__(self):
+        import coincurve
+        self._coincurve = coincurve
+
+    def public_key(self, secret):
+        return self._coincurve.PrivateKey(secret.to_bytes(32, 'big')).public_key.point()
+
+    def sign(self, secret, _hash, nonces=None):
+        # libsecp256k1 always signs with RFC 6979 nonces, the same ones `nonces` would give, so only random nonces
+        # (no `nonces`) have to go through the pure-Python code
+        if len(_hash) != DIGEST_SIZE or nonces is None:
+            return PYTHON.sign(secret, _hash, nonces)
+        signature = self._coincurve.PrivateKey(secret.to_bytes(32, 'big')).sign_recoverable(_hash, hasher=None)
+        return bytes_to_int(signature[:32]), bytes_to_int(signature[32:64]), signature[64]
+
+    def verify(self, _hash, r, s, point):
+        from witnet.crypto.secp256k1.secp256k1 import Signature
+
+        if len(_hash) != DIGEST_SIZE:
+            return PYTHON.verify(_hash, r, s, point)
+        # libsecp256k1 only accepts low s values, (r, N - s) is the equivalent signature
+        der = Signature(r, s, force_low_s=True).encode()
+        try:
+            public_key = self._coincurve.PublicKey.from_point(point.x, point.y)
+        except ValueError:
+            # a point libsecp256k1 rejects (e.g. coordinates not reduced mod P) verifies nothing, as on the other backends
+            return False
+        return public_key.verify(der, _hash, hasher=None)
+
+    def recover(self, _hash, r, s, recid):
+        from witnet.crypto.secp256k1.secp256k1 import N
+
+        if len(_hash) != DIGEST_SIZE:
+            return PYTHON.recover(_hash, r, s, recid)
+        if s > N // 2:
+            # the recoverable format must be low s as well
+            s, recid = N - s, recid ^ 1
+        signature = r.to_bytes(32, 'big') + s.to_bytes(32, 'big') + bytes([recid])
+        try:
+            return self._coincurve.PublicKey.from_signature_and_message(signature, _hash, hasher=None).point()
+        except ValueError:
+            raise AssertionError('Signature does not recover to a valid public key') from None
+
+    def tweak_add(self, point, tweak):
+        if not tweak:
+            return point.x, point.y
+        try:
+            return self._coincurve.PublicKey.from_point(point.x, point.y).add(tweak.to_bytes(32, 'big')).point()
+        except ValueError:
+            return None
+
+    def tweak_add_many(self, point, tweaks):
+        return [self.tweak_add(point, tweak) for tweak in tweaks]
+
+
+class CryptographyBackend(PythonBackend):
+    """
+    OpenSSL through https://cryptography.io, for verification only. OpenSSL has to rebuild a key object for every
+    call, which makes its key generation and signing several times slower than the pure-Python generator table,
+    so everything but `verify` is inherited from PythonBackend.
+    """
+    name = 'cryptography'
+
+    def __init__(self):
+        from cryptography.exceptions import InvalidSignature
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import ec, utils
+        self._ec, self._utils = ec, utils
+        self._invalid_signature = InvalidSignature
+        self._algorithm = ec.ECDSA(utils.Prehashed(hashes.SHA256()))
+
+    def verify(self, _hash, r, s, point):
+        if len(_hash) != DIGEST_SIZE:
+            return PYTHON.verify(_hash, r, s, point)
+        public_key = self._ec.EllipticCurvePublicNumbers(point.x, point.y, self._ec.SECP256K1()).public_key()
+        try:
+            public_key.verify(self._utils.encode_dss_signature(r, s), _hash, self._algorithm)
+        except self._invalid_signature:
+            return False
+        return True
+
+    def verify_many(self, rows):
+        return [self.verify(*row) for row in rows]
+
+
+PYTHON = PythonBackend()
+
+BACKENDS = {
+    PythonBackend.name: PythonBackend,
+    LadderBackend.name: LadderBackend,
+    CoincurveBackend.name: CoincurveBackend,
+    CryptographyBackend.name: CryptographyBackend,
+}
+
+_backend = None
+
+
+def load_backend(name: str) -> Backend:
+    """Instantiate a backend by name, raises ImportError if its library is not installed"""
+    if name not in BACKENDS:
+        raise ValueError(f'Unknown secp256k1 backend: {name}, expected one of {list(BACKENDS)}')
+    return PYTHON if name == PythonBackend.name else BACKENDS[name]()
+
+
+def available_backends() -> List[str]:
+    available = []
+    for name in AUTO_ORDER:
+        try:
+            load_backend(name)
+        except ImportError:
+            continue
+        available.append(name)
+    return available
+
+
+def set_backend(name: str) -> Backend:
+    """Select the backend used by WitPrivateKey, WitPublicKey and Signature for the rest of the process"""
+    global _backend
+    if name == 'auto':
+        name = available_backends()[0]
+    _backend = load_backend(name)
+    return _backend
+
+
+def get_backend() -> Backend:
+    if _backend is None:
+        return set_backend(os.environ.get(BACKEND_ENV, 'auto'))
+    return _backend
@@ -0,0 +1,56 @@
+import hashlib
+import hmac
+from typing import Iterator
+
+from witnet.util.transformations import bytes_to_int
+
+
+class NonceGenerator:
+    """
+    Deterministic ECDSA nonces for a single private key
+    https://datatracker.ietf.org/doc/html/rfc6979#section-3.2
+
+    The first HMAC of every signature is keyed with zeros and starts with V || 0x00 || int2octets(x), none of which
+    depends on the message, so that state is computed once and copied for each hash.
+    """
+
+    def __init__(self, secret: int, order: int, digestmod=hashlib.sha256):
+        self.order = order
+        self.digestmod = digestmod
+        self.qlen = order.bit_length()
+        self.rlen = (self.qlen + 7) // 8
+        self.hlen = digestmod().digest_size
+        self._x = secret.to_bytes(self.rlen, 'big')
+        self._prefix = hmac.new(b'\x00' * self.hlen, b'\x01' * self.hlen + b'\x00' + self._x, digestmod)
+
+    def bits2int(self, bts: bytes) -> int:
+        i = bytes_to_int(bts)
+        excess = len(bts) * 8 - self.qlen
+        return i >> excess if excess > 0 else i
+
+    def bits2octets(self, bts: bytes) -> bytes:
+        return (self.bits2int(bts) % self.order).to_bytes(self.rlen, 'big')
+
+    def nonces(self, _hash: bytes) -> Iterator[int]:
+        """Candidate nonces for a message hash, in the order RFC 6979 generates them"""
+        h1 = self.bits2octets(_hash)
+
+        # steps b-g
+        mac = self._prefix.copy()
+        mac.update(h1)
+        k = mac.digest()
+        v = hmac.new(k, b'\x01' * self.hlen, self.digestmod).digest()
+        k = hmac.new(k, v + b'\x01' + self._x + h1, self.digestmod).digest()
+        v = hmac.new(k, v, self.digestmod).digest()
+
+        # step h
+        while True:
+            t = b''
+            while len(t) < self.rlen:
+                v = hmac.new(k, v, self.digestmod).digest()
+                t += v
+            candidate = self.bits2int(t)
+            if 1 <= candidate < self.order:
+                yield candidate
+            k = hmac.new(k, v + b'\x00', self.digestmod).digest()
+            v = hmac.new(k, v, self.digestmod).digest()
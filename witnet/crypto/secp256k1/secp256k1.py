@@ -1,16 +1,14 @@
-from dataclasses import dataclass
-from typing import Tuple, Union
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List, Tuple, Union
+import os
 import secrets
 
 from witnet.crypto import number_theory as nt, message
-from witnet.schema import KeyedSignature
-from witnet.schema.secp256k1_signature import Secp256k1Signature
-from witnet.schema.signature import Signature
-from witnet.schema.vt_transaction import VTTransaction
-
-from witnet.util.transformations import hex_to_int, sha256, int_to_hex
-
-from witnet.schema.public_key import PublicKey
+from witnet.crypto.secp256k1.backends import get_backend
+from witnet.crypto.secp256k1.rfc6979 import NonceGenerator
+from witnet.util.pool import chunked, pool_map, pool_processes
+from witnet.util.transformations import sha256, int_to_hex
 from witnet.util.transformations import bytes_to_int, bytes_to_hex, int_to_bytes, hex_to_bytes
 P = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
 
@@ -21,22 +19,62 @@ G = 0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798, \
 # Order
 N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
 
+nt.register_prime(P, N)
+
 # Elliptic curve parameters A and B of the curve : y² = x³ Ax + B
 A: int = 0
 B: int = 7
 
+# Point at infinity in Jacobian (X, Y, Z) coordinates
+INFINITY = (1, 1, 0)
+
+# Window width (in bits) of the precomputed generator table
+GENERATOR_WINDOW = 6
+
+# Width of the non-adjacent form used for variable-base multiplication
+WNAF_WINDOW = 5
+
+# Number of decoded public keys kept by `decode_point`
+DECODE_CACHE_SIZE = 4096
+
+# Batches with at least this many signatures are verified across a process pool
+BATCH_POOL_THRESHOLD = 256
+
+
+def wnaf(d: int, w: int = WNAF_WINDOW) -> list:
+    """Width-w non-adjacent form of d, least significant digit first. Non-zero digits are odd and |digit| < 2^(w-1)"""
+    digits = []
+    full, half = 1 << w, 1 << (w - 1)
+    while d:
+        if d & 1:
+            digit = d & (full - 1)
+            if digit >= half:
+                digit -= full
+            d -= digit
+        else:
+            digit = 0
+        digits.append(digit)
+        d >>= 1
+    return digits
 
 
 class Point:
+    """
+    Affine point. Coordinates are only checked against the curve when `validate` is set, which is left on for points
+    built from user input and turned off for the results of curve arithmetic, which are on the curve by construction.
+    """
+    __slots__ = ('x', 'y', 'curve', '_odd_multiples')
 
-    def __init__(self, x, y, curve=None):
+    def __init__(self, x, y, curve=None, validate=True):
         self.x = x
         self.y = y
-        self.curve = curve
-        assert self in curve, f"Point {x}, {y} not in curve"
+        self.curve = curve if curve is not None else CURVE
+        self._odd_multiples = None
+        if validate:
+            assert self in self.curve, f"Point {x}, {y} not in curve"
 
     def __add__(self, other):
-        assert self.curve == other.curve, 'Cannot add points on different curves'
+        assert self.curve is other.curve, 'Cannot add points on different curves'
         return self.curve.point_add(self, other)
 
     def __sub__(self, other):
@@ -50,6 +88,8 @@ class Point:
         return f"Point({self.x}, {self.y}, {self.curve.name})"
 
     def __eq__(self, other):
+        if not isinstance(other, Point):
+            return NotImplemented
         return self.x % self.curve.prime == other.x % self.curve.prime \
                and self.y % self.curve.prime == other.y % self.curve.prime
 
@@ -62,40 +102,235 @@ class Curve:
     generator: Union[Tuple, Point]
     order: int  # N
     name: str
+    _generator_table: list = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if type(self.generator).__name__ == 'tuple':
-            print('-----')
             self.generator = Point(*self.generator, curve=self)
 
     def point_add(self, p, q):
         """https://en.wikipedia.org/wiki/Elliptic_curve_point_multiplication#Point_addition"""
-        _p = self.prime
-        if p == q:
-            lam = (3 * p.x * p.x) * pow(2 * p.y % _p, _p - 2, _p)
-        else:
-            lam = pow(q.x - p.x, _p - 2, _p) * (q.y - p.y) % _p
-
-        rx = lam ** 2 - p.x - q.x
-        ry = lam * (p.x - rx) - p.y
-        return Point(rx % _p, ry % _p, curve=self)
+        if p is None:
+            return q
+        if q is None:
+            return p
+        return self._from_jacobian(self._jacobian_add(self._to_jacobian(p), self._to_jacobian(q)))
 
     def point_mul(self, p, d):
+        """Scalar multiplication in Jacobian coordinates, with a single inversion at the end"""
         d = d % self.order
+        if not d:
+            return None
+        if self.is_generator(p):
+            return self._from_jacobian(self._generator_mul(d))
+        return self._from_jacobian(self._wnaf_mul(p, d))
+
+    def ladder_mul(self, p, d):
+        """
+        d * P with a Montgomery ladder. The scalar is padded to a fixed length by adding multiples of the order and
+        every bit costs one addition and one doubling whatever its value, so the sequence of operations does not
+        depend on the (secret) scalar. About twice as slow as the wNAF path and ten times slower than the generator
+        table, see `python -m witnet.tests.benchmark scalar_mul`.
+        """
+        bits = self.order.bit_length()
+        d = d % self.order + self.order
+        if d.bit_length() <= bits:
+            d += self.order
+
+        r = [self._to_jacobian(p), self._jacobian_double(self._to_jacobian(p))]
+        for i in range(bits - 1, -1, -1):
+            b = (d >> i) & 1
+            r[1 - b] = self._jacobian_add(r[0], r[1])
+            r[b] = self._jacobian_double(r[b])
+        return self._from_jacobian(r[0])
+
+    def multi_mul(self, terms):
+        """
+        Sum of d * P over (P, d) pairs using Strauss–Shamir interleaving: the variable-base terms share a single
+        chain of doublings over their wNAF digits, and any generator terms are added from the fixed-base table.
+        """
+        return self._from_jacobian(self._multi_mul(terms))
+
+    def _multi_mul(self, terms):
+        _p = self.prime
+        g_scalar = 0
+        tables, digits = [], []
+        for p, d in terms:
+            d = d % self.order
+            if not d:
+                continue
+            if self.is_generator(p):
+                g_scalar += d
+            else:
+                tables.append(self.odd_multiples(p))
+                digits.append(wnaf(d))
+
+        q = INFINITY
+        for i in range(max(map(len, digits), default=0) - 1, -1, -1):
+            q = self._jacobian_double(q)
+            for table, ds in zip(tables, digits):
+                digit = ds[i] if i < len(ds) else 0
+                if digit > 0:
+                    q = self._jacobian_add(q, table[digit >> 1])
+                elif digit < 0:
+                    x, y, z = table[-digit >> 1]
+                    q = self._jacobian_add(q, (x, _p - y, z))
+
+        g_scalar %= self.order
+        if g_scalar:
+            q = self._jacobian_add(q, self._generator_mul(g_scalar))
+        return q
 
-        n = p
-        q = None
-
-        for i in reversed(format(d, 'b')):
-            if i == '1':
-                if q is None:
-                    q = n
-                else:
-                    q = self.point_add(q, n)
+    def is_generator(self, p) -> bool:
+        g = self.generator
+        return p is g or (p.x == g.x and p.y == g.y)
+
+    def generator_table(self):
+        """
+        Fixed-base table for the generator, built on first use and cached on the curve.
+        Row i holds j * 2^(GENERATOR_WINDOW * i) * G for j in [0, 2^GENERATOR_WINDOW), in affine (Z = 1) form,
+        so a multiplication by G is one table lookup and one mixed addition per window and no doublings.
+        """
+        if self._generator_table is None:
+            rows = -(-self.order.bit_length() // GENERATOR_WINDOW)
+            base = self._to_jacobian(self.generator)
+            points = []
+            for _ in range(rows):
+                acc = INFINITY
+                for _ in range((1 << GENERATOR_WINDOW) - 1):
+                    acc = self._jacobian_add(acc, base)
+                    points.append(acc)
+                base = self._jacobian_add(acc, base)
+            points = iter(self._normalize(points))
+            self._generator_table = [
+                [INFINITY] + [next(points) for _ in range((1 << GENERATOR_WINDOW) - 1)] for _ in range(rows)
+            ]
+        return self._generator_table
+
+    def _generator_mul(self, d):
+        """d * G in Jacobian coordinates using the fixed-base generator table"""
+        mask = (1 << GENERATOR_WINDOW) - 1
+        q = INFINITY
+        for row in self.generator_table():
+            if not d:
+                break
+            digit = d & mask
+            if digit:
+                q = self._jacobian_add(q, row[digit])
+            d >>= GENERATOR_WINDOW
+        return q
 
-            n = self.point_add(n, n)
+    def generator_mul_many(self, scalars, offset=None):
+        """
+        [d * G + offset for d in scalars] from the fixed-base table, kept in Jacobian form and normalised together
+        with a single batched inversion. The point at infinity comes out as None.
+        """
+        q = INFINITY if offset is None else self._to_jacobian(offset)
+        return self._from_jacobian_many([self._jacobian_add(self._generator_mul(d % self.order), q) for d in scalars])
+
+    def odd_multiples(self, p):
+        """[P, 3P, 5P, ..., (2^(WNAF_WINDOW - 1) - 1)P] in affine (Z = 1) form, computed once and cached on the point"""
+        if p._odd_multiples is None:
+            p1 = self._to_jacobian(p)
+            p2 = self._jacobian_double(p1)
+            table = [p1]
+            for _ in range((1 << (WNAF_WINDOW - 2)) - 1):
+                table.append(self._jacobian_add(table[-1], p2))
+            p._odd_multiples = [p1] + self._normalize(table[1:])
+        return p._odd_multiples
+
+    def _wnaf_mul(self, p, d):
+        """d * P in Jacobian coordinates, one doubling per bit and one addition per non-zero wNAF digit"""
+        _p = self.prime
+        table = self.odd_multiples(p)
+        q = INFINITY
+        for digit in reversed(wnaf(d)):
+            q = self._jacobian_double(q)
+            if digit > 0:
+                q = self._jacobian_add(q, table[digit >> 1])
+            elif digit < 0:
+                x, y, z = table[-digit >> 1]
+                q = self._jacobian_add(q, (x, _p - y, z))
         return q
 
+    @staticmethod
+    def _to_jacobian(p):
+        return p.x, p.y, 1
+
+    def _from_jacobian(self, p):
+        """Convert (X, Y, Z) to the affine point (X / Z², Y / Z³), or None for the point at infinity"""
+        x, y, z = p
+        if not z:
+            return None
+        _p = self.prime
+        z_inv = nt.mulinv(z, _p)
+        z_inv2 = z_inv * z_inv % _p
+        return Point(x * z_inv2 % _p, y * z_inv2 * z_inv % _p, curve=self, validate=False)
+
+    def _from_jacobian_many(self, points):
+        """`_from_jacobian` for many points, sharing a single inversion"""
+        return [Point(x, y, curve=self, validate=False) if z else None for x, y, z in self._normalize(points)]
+
+    def _normalize(self, points):
+        """Scale Jacobian points to Z = 1 with a single batched inversion, the point at infinity is left as it is"""
+        _p = self.prime
+        finite = [i for i, (_, _, z) in enumerate(points) if z]
+        inverses = nt.batch_mulinv([points[i][2] for i in finite], _p)
+        result = list(points)
+        for i, z_inv in zip(finite, inverses):
+            x, y, _ = points[i]
+            z_inv2 = z_inv * z_inv % _p
+            result[i] = (x * z_inv2 % _p, y * z_inv2 * z_inv % _p, 1)
+        return result
+
+    def _jacobian_double(self, p):
+        """https://hyperelliptic.org/EFD/g1p/auto-shortw-jacobian.html#doubling-dbl-1998-cmo-2"""
+        x, y, z = p
+        if not y or not z:
+            return INFINITY
+        _p = self.prime
+        yy = y * y % _p
+        s = 4 * x * yy % _p
+        m = 3 * x * x
+        if self.a:
+            m += self.a * pow(z, 4, _p)
+        m %= _p
+        rx = (m * m - 2 * s) % _p
+        ry = (m * (s - rx) - 8 * yy * yy) % _p
+        rz = 2 * y * z % _p
+        return rx, ry, rz
+
+    def _jacobian_add(self, p, q):
+        """https://hyperelliptic.org/EFD/g1p/auto-shortw-jacobian.html#addition-add-1998-cmo-2"""
+        x1, y1, z1 = p
+        x2, y2, z2 = q
+        if not z1:
+            return q
+        if not z2:
+            return p
+        _p = self.prime
+        z1z1 = z1 * z1 % _p
+        u2 = x2 * z1z1 % _p
+        s2 = y2 * z1 * z1z1 % _p
+        if z2 == 1:  # mixed addition with an affine point
+            u1, s1 = x1, y1
+        else:
+            z2z2 = z2 * z2 % _p
+            u1 = x1 * z2z2 % _p
+            s1 = y1 * z2 * z2z2 % _p
+        h = (u2 - u1) % _p
+        r = (s2 - s1) % _p
+        if not h:
+            # same x coordinate: either the same point or its negation
+            return self._jacobian_double(p) if not r else INFINITY
+        hh = h * h % _p
+        hhh = h * hh % _p
+        v = u1 * hh % _p
+        rx = (r * r - hhh - 2 * v) % _p
+        ry = (r * (v - rx) - s1 * hhh) % _p
+        rz = h * z1 * z2 % _p if z2 != 1 else h * z1 % _p
+        return rx, ry, rz
+
     def __contains__(self, point):
         return point.y ** 2 % self.prime == (point.x ** 3 + self.a * point.x + self.b) % self.prime
 
@@ -112,6 +347,7 @@ class WitPrivateKey(message.Message):
     def __init__(self, bts):
         assert bytes_to_int(bts) < N, 'Key larger than Curve Order'
         super().__init__(bts)
+        self._nonce_generator = None
 
     @classmethod
     def random(cls):
@@ -119,26 +355,32 @@ class WitPrivateKey(message.Message):
         return cls.from_int(key)
 
     def to_public(self) -> 'WitPublicKey':
-        point = CURVE.generator * self.int()
-        return WitPublicKey(point)
+        x, y = get_backend().public_key(self.int())
+        return WitPublicKey(Point(x, y, curve=CURVE, validate=False))
 
     def __repr__(self):
         return f"PrivateKey({self.msg.hex()})"
 
-    def sign_hash(self, _hash) -> Signature:
-        e = hex_to_int(_hash) if isinstance(_hash, str) else bytes_to_int(_hash)
-        r, s = 0, 0
-        while r == 0 or s == 0:
-            k = secrets.randbelow(N)
-            point = CURVE.generator * k
-            r = point.x % N
-
-            inv_k = nt.mulinv(k, N)
-            s = (inv_k * (e + r * self.int())) % N
+    def nonce_generator(self) -> NonceGenerator:
+        """RFC 6979 nonce generator for this key, created on first use and reused by every later signature"""
+        if self._nonce_generator is None:
+            self._nonce_generator = NonceGenerator(self.int(), N)
+        return self._nonce_generator
+
+    def sign_hash(self, _hash, deterministic=True) -> 'Signature':
+        """
+        Sign a message hash. Deterministic signatures (RFC 6979) are the same for the same key and hash,
+        set `deterministic` to False to use a random nonce instead.
+        """
+        _hash = hex_to_bytes(_hash) if isinstance(_hash, str) else bytes(_hash)
+        nonces = self.nonce_generator().nonces(_hash) if deterministic else None
+        r, s, recid = get_backend().sign(self.int(), _hash, nonces)
+        return Signature(r=r, s=s, recid=recid)
+
+    def sign_vtt(self, transaction) -> 'VTTransaction':
+        # the schema package is only needed here, importing it with the module would slow down startup
+        from witnet.schema import KeyedSignature, Secp256k1Signature, Signature
 
-        return Signature(r=r, s=s)
-
-    def sign_vtt(self, transaction) -> VTTransaction:
         vtt_body = transaction.body
         vtt_hash = sha256(vtt_body.to_pb_bytes())
 
@@ -165,20 +407,7 @@ class WitPublicKey:
 
     @classmethod
     def decode(cls, key: bytes) -> 'WitPublicKey':
-        if key.startswith(b'\x04'):  # uncompressed key
-            assert len(key) == 65, 'An uncompressed public key must be 65 bytes long'
-            x, y = bytes_to_int(key[1:33]), bytes_to_int(key[33:])
-        else:  # compressed key
-            assert len(key) == 33, 'A compressed public key must be 33 bytes long'
-            x = bytes_to_int(key[1:])
-            root = nt.modsqrt(CURVE.f(x), P)
-            if key.startswith(b'\x03'):  # odd root
-                y = root if root % 2 == 1 else -root % P
-            elif key.startswith(b'\x02'):  # even root
-                y = root if root % 2 == 0 else -root % P
-            else:
-                assert False, 'Wrong key format'
-        return cls(Point(x, y, curve=CURVE))
+        return cls(decode_point(bytes(key)))
 
     @classmethod
     def from_hex(cls, hexstring: str) -> 'WitPublicKey':
@@ -206,7 +435,9 @@ class WitPublicKey:
         enc = self.encode(compressed=compressed)
         return {'bytes': list(enc[1::]), 'compressed': enc[0]}
 
-    def pub_key(self):
+    def pub_key(self) -> 'PublicKey':
+        from witnet.schema.public_key import PublicKey
+
         if self.y & 1:  # odd root
             return PublicKey(_bytes=int_to_bytes(self.x).rjust(32, b'\x00'), compressed=3)
         else:  # even root
@@ -218,7 +449,7 @@ class WitPublicKey:
         return WitPublicKey.from_hex(bytes_to_hex((int_to_bytes(_compressed) + bytes(_bytes).rjust(32, b'\x00'))))
 
     @classmethod
-    def from_schema(cls, public_key: PublicKey):
+    def from_schema(cls, public_key: 'PublicKey'):
         return WitPublicKey.from_json(public_key.to_json())
 
     def hex(self, compressed=True) -> str:
@@ -234,14 +465,50 @@ class WitPublicKey:
         from witnet.witnet.address import pubkey_to_pkh
         return pubkey_to_pkh(self)
 
+@lru_cache(maxsize=DECODE_CACHE_SIZE)
+def decode_point(key: bytes) -> Point:
+    """
+    Decode a SEC1 encoded public key. Results are cached by their encoding, so a signer key seen again while scanning
+    blocks costs a dictionary lookup and keeps the wNAF table built for it by earlier verifications.
+    """
+    return decode_point_uncached(key)
+
+
+def decode_point_uncached(key: bytes) -> Point:
+    """`decode_point` for one-off points, such as the nonce point of a recovery, that must not evict cached keys"""
+    if key.startswith(b'\x04'):  # uncompressed key
+        assert len(key) == 65, 'An uncompressed public key must be 65 bytes long'
+        x, y = bytes_to_int(key[1:33]), bytes_to_int(key[33:])
+        assert x < P and y < P, 'Coordinates larger than the field prime'
+        return Point(x, y, curve=CURVE)
+
+    # compressed key
+    assert len(key) == 33, 'A compressed public key must be 33 bytes long'
+    assert key[0] in (2, 3), 'Wrong key format'
+    x = bytes_to_int(key[1:])
+    assert x < P, 'X coordinate larger than the field prime'
+    y2 = CURVE.f(x)
+    # P = 3 (mod 4), so a square root is a single exponentiation
+    root = pow(y2, (P + 1) // 4, P)
+    assert root * root % P == y2, f'Point with x {x} not in curve'
+    if root & 1 != key[0] & 1:  # 0x03 means odd root, 0x02 even root
+        root = P - root
+    return Point(x, root, curve=CURVE, validate=False)
+
+
 class Signature:
 
-    def __init__(self, r, s, force_low_s=True):
+    def __init__(self, r, s, force_low_s=True, recid=None):
         self.r = r
+        # recovery id: bit 0 is the parity of R.y, bit 1 is set when R.x >= N (see `recover_public_key`)
+        self.recid = recid
 
-        if force_low_s:
+        if force_low_s and s > N // 2:
             # https://github.com/bitcoin/bips/blob/master/bip-0062.mediawiki#low-s-values-in-signatures
-            self.s = s if s <= N // 2 else N - s
+            # negating s is the same as negating R, which flips the parity of R.y
+            self.s = N - s
+            if recid is not None:
+                self.recid = recid ^ 1
         else:
             self.s = s
 
@@ -289,18 +556,10 @@ class Signature:
         return b'\x30' + len_sig + b'\x02' + len_r + r + b'\x02' + len_s + s
 
     def verify_hash(self, _hash, public_key):
-        from witnet.crypto.number_theory import mulinv
-
         public_key: WitPublicKey = public_key
         if not (1 <= self.r < N and 1 <= self.s < N):
             return False
-
-        e = bytes_to_int(_hash)
-        w = mulinv(self.s, N)
-        u1 = (e * w) % N
-        u2 = (self.r * w) % N
-        point: Point = CURVE.generator * u1 + public_key.point * u2
-        return self.r % N == point.x % N
+        return get_backend().verify(bytes(_hash), self.r, self.s, public_key.point)
 
     @classmethod
     def from_hex(cls, hex_string):
@@ -316,6 +575,71 @@ class Signature:
         return bytes_to_hex(self.encode())
 
 
+def recover_public_key(_hash, signature: 'Signature', recid: int = None) -> 'WitPublicKey':
+    """
+    Public key that produced `signature` over `_hash`, Q = r⁻¹(sR - eG), where R is the nonce point picked out by the
+    recovery id (defaults to the one stored on the signature when it was created by `sign_hash`)
+    """
+    recid = signature.recid if recid is None else recid
+    assert recid is not None, 'Signature has no recovery id (e.g. decoded from DER), pass recid explicitly'
+    assert recid in range(4), f'Invalid recovery id: {recid}'
+    assert 1 <= signature.r < N and 1 <= signature.s < N, 'Invalid signature'
+    _hash = hex_to_bytes(_hash) if isinstance(_hash, str) else bytes(_hash)
+    x, y = get_backend().recover(_hash, signature.r, signature.s, recid)
+    return WitPublicKey(Point(x, y, curve=CURVE, validate=False))
+
+
+def verify_batch(items, processes=None, pool_threshold=BATCH_POOL_THRESHOLD) -> List[bool]:
+    """
+    Verify a list of (hash, signature, public key) triples and return one result per item, in order.
+    Signatures may be given as `Signature` or DER bytes and public keys as `WitPublicKey` or encoded bytes;
+    items that fail to decode are reported as False. Each distinct public key is turned into a single point so
+    its wNAF table is shared by all of its signatures, the s⁻¹ of all signatures are computed with one batched
+    inversion, and batches of at least `pool_threshold` items are split
+    across a pool of `processes` worker processes (see `pool_processes`).
+    """
+    results = [False] * len(items)
+    rows = []
+    for index, (_hash, signature, public_key) in enumerate(items):
+        try:
+            if not isinstance(signature, Signature):
+                signature = Signature.decode(signature)
+            if not isinstance(public_key, WitPublicKey):
+                public_key = WitPublicKey.decode(public_key)
+        except (AssertionError, IndexError):
+            continue
+        rows.append((index, bytes(_hash), signature.r, signature.s, public_key.x, public_key.y))
+
+    processes = pool_processes(processes, len(rows), pool_threshold)
+    if processes == 1:
+        verified = _verify_rows(rows)
+    else:
+        tasks = ((chunk,) for chunk in chunked(rows, -(-len(rows) // (processes * 4))))
+        verified = [result for chunk in pool_map(_verify_rows, tasks, processes) for result in chunk]
+
+    for (index, *_), result in zip(rows, verified):
+        results[index] = result
+    return results
+
+
+def _verify_rows(rows) -> List[bool]:
+    """Worker for `verify_batch`, rows are plain (index, hash, r, s, x, y) tuples so they pickle cheaply"""
+    keys = {}
+    results = [False] * len(rows)
+    valid, batch = [], []
+    for i, (_, _hash, r, s, x, y) in enumerate(rows):
+        if not (1 <= r < N and 1 <= s < N):
+            continue
+        point = keys.get((x, y))
+        if point is None:
+            point = keys[(x, y)] = Point(x, y, curve=CURVE, validate=False)
+        valid.append(i)
+        batch.append((_hash, r, s, point))
+    for i, result in zip(valid, get_backend().verify_many(batch)):
+        results[i] = result
+    return results
+
+
 def is_signature(hex_string):
     try:
         if isinstance(hex_string, bytes):
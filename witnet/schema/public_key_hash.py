@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from witnet.util.protobuf.wire_type import pb_field, LENGTH_DELIMITED
 from witnet.util.transformations import bytes_to_hex, sha256
-from witnet.util.transformations.bech32 import bech32_decode_address, bech32_encode_address
+from witnet.util.bech32 import bech32_decode_address, bech32_encode_address
 
 
 @dataclass
@@ -0,0 +1,129 @@
+"""
+Throughput of the hot paths, run with `python -m witnet.tests.benchmark [name ...]`
+"""
+import random
+import sys
+import timeit
+
+from witnet.crypto import number_theory as nt
+from witnet.crypto.secp256k1 import CURVE, WitPrivateKey, available_backends, get_backend, set_backend
+from witnet.crypto.secp256k1.secp256k1 import N
+from witnet.util.transformations import sha256
+
+
+def report(name: str, stmt, number: int, repeat: int = 3, per: int = 1) -> float:
+    """Print and return the best time in seconds per call of `stmt`, or per item when each call handles `per` items"""
+    seconds = min(timeit.repeat(stmt, number=number, repeat=repeat)) / number / per
+    print(f'{name:<48} {seconds * 1e6:>12.1f} µs/op {1 / seconds:>12.1f} op/s')
+    return seconds
+
+
+def bench_scalar_mul(number=100):
+    """Variable-time generator table and wNAF paths against the fixed-iteration ladder"""
+    secret = WitPrivateKey.from_hex('cd' * 32).int()
+    point = CURVE.generator * 3
+    CURVE.generator_table()
+
+    report('G * k (generator table)', lambda: CURVE.generator * secret, number)
+    report('G * k (ladder)', lambda: CURVE.ladder_mul(CURVE.generator, secret), number)
+    report('P * k (wNAF)', lambda: point * secret, number)
+    report('P * k (ladder)', lambda: CURVE.ladder_mul(point, secret), number)
+
+
+def bench_sign(number=100):
+    """sign_hash (RFC 6979 and random nonces), public keys and verification through each available backend"""
+    secret_key = WitPrivateKey.from_hex('cd' * 32)
+    public_key = secret_key.to_public()
+    _hash = sha256(b'witnet')
+    signature = secret_key.sign_hash(_hash)
+    default = get_backend().name
+    try:
+        for name in available_backends() + ['python-ladder']:
+            set_backend(name)
+            report(f'sign_hash ({name})', lambda: secret_key.sign_hash(_hash), number)
+            report(f'sign_hash, random nonce ({name})', lambda: secret_key.sign_hash(_hash, deterministic=False),
+                   number)
+            report(f'verify_hash ({name})', lambda: signature.verify_hash(_hash, public_key), number)
+            report(f'public key ({name})', lambda: get_backend().public_key(secret_key.int()), number)
+    finally:
+        set_backend(default)
+
+
+def bench_mulinv(number=1000, batch=256):
+    """Modular inverses mod N"""
+    values = [random.randrange(1, N) for _ in range(batch)]
+    value = values[0]
+
+    report('mulinv (xgcd)', lambda: nt.mulinv(value, N, algo=nt.xgcd), number)
+    report('mulinv (egcd)', lambda: nt.mulinv(value, N, algo=nt.egcd), number)
+    report('mulinv (pow)', lambda: nt.mulinv(value, N), number)
+    report(f'batch_mulinv ({batch} values, per value)', lambda: nt.batch_mulinv(values, N), number // batch or 1,
+           per=batch)
+
+
+def bench_derivation(number=100):
+    """Non-hardened child derivation, the inner loop of address scanning"""
+    from witnet.crypto.hd_wallet.extended_private_key import Xprv
+
+    account = Xprv.from_seed('000102030405060708090a0b0c0d0e0f') // 0
+    xpub = account.to_xpub()
+    CURVE.generator_table()
+
+    report('Xprv.child', lambda: account.child(1), number)
+    report('Xpub.child', lambda: xpub.child(1), number)
+    report('Xpub.children (64 keys, per key)', lambda: xpub.children(range(64)), number // 64 or 1, per=64)
+
+
+def bench_mnemonic(number=1000):
+    """Per-phrase cost of validating and converting 24 word mnemonics"""
+    from witnet.crypto.bip39.mnemonic import Mnemonic
+
+    m = Mnemonic('english')
+    code = m.to_mnemonic(bytes(range(32)))
+    words = code.split(' ')
+
+    report('Mnemonic.check', lambda: m.check(code), number)
+    report('Mnemonic.to_entropy', lambda: m.to_entropy(words), number)
+    report('Mnemonic.to_mnemonic', lambda: m.to_mnemonic(bytes(range(32))), number)
+    report('Mnemonic.detect_language', lambda: Mnemonic.detect_language(code), number)
+    prefixes = ' '.join(word[:4] for word in words)
+    report('Mnemonic.expand', lambda: m.expand(prefixes), number)
+
+
+def bench_bech32(number=10, batch=1000):
+    """Address encoding and decoding, per address"""
+    from witnet.util.bech32 import bech32_decode_address, bech32_encode_address, decode_many, encode_many
+
+    payloads = [sha256(i.to_bytes(4, 'big'))[:20] for i in range(batch)]
+    addresses = encode_many('wit', payloads)
+
+    report('bech32_encode_address', lambda: [bech32_encode_address('wit', p.hex()) for p in payloads], number, per=batch)
+    report('bech32_decode_address', lambda: [bech32_decode_address(a) for a in addresses], number, per=batch)
+    report('encode_many', lambda: encode_many('wit', payloads), number, per=batch)
+    report('decode_many', lambda: decode_many(addresses, hrp='wit'), number, per=batch)
+
+
+def bench_startup():
+    """Cumulative `python -X importtime` figures for the entry points of the library"""
+    from witnet.tests.test_startup import importtime
+
+    for module in ('witnet.crypto.number_theory', 'witnet.crypto.secp256k1', 'witnet.witnet.address',
+                   'witnet.crypto.hd_wallet.extended_private_key', 'witnet.schema'):
+        times, _ = importtime(module)
+        print(f'import {module:<48} {times[module] / 1000:>8.1f} ms')
+
+
+BENCHMARKS = {
+    'bech32': bench_bech32,
+    'derivation': bench_derivation,
+    'mnemonic': bench_mnemonic,
+    'mulinv': bench_mulinv,
+    'scalar_mul': bench_scalar_mul,
+    'sign': bench_sign,
+    'startup': bench_startup,
+}
+
+if __name__ == '__main__':
+    for benchmark in sys.argv[1:] or BENCHMARKS:
+        print(f'--- {benchmark}')
+        BENCHMARKS[benchmark]()
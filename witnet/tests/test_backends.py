@@ -0,0 +1,109 @@
+import unittest
+
+from witnet.crypto.secp256k1 import Signature, WitPrivateKey, available_backends
+from witnet.crypto.secp256k1.backends import load_backend, PYTHON, PythonBackend
+from witnet.util.transformations import hex_to_bytes, concat
+
+secrets = [1, 2, 0xcd * (2 ** 256 - 1) // 0xff, 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364140]
+hashes = [hex_to_bytes(concat([b for _ in range(32)])) for b in ('00', 'ab', 'ff')]
+
+native = [name for name in available_backends() if name != PYTHON.name]
+
+
+def sign(backend, secret, _hash, nonces=None) -> Signature:
+    r, s, recid = backend.sign(secret, _hash, nonces)
+    return Signature(r, s, recid=recid)
+
+
+@unittest.skipUnless(native, 'no native secp256k1 backend installed')
+class TestBackends(unittest.TestCase):
+
+    def test_public_key(self):
+        for name in native:
+            backend = load_backend(name)
+            for secret in secrets:
+                self.assertEqual(backend.public_key(secret), PYTHON.public_key(secret), name)
+
+    def test_sign_and_verify(self):
+        backends = [PYTHON] + [load_backend(name) for name in native]
+        for secret in secrets:
+            point = WitPrivateKey.from_int(secret).to_public().point
+            for _hash in hashes:
+                for signer in backends:
+                    signature = sign(signer, secret, _hash)
+                    der = signature.encode()
+                    self.assertEqual(Signature.decode(der).encode(), der)
+                    for verifier in backends:
+                        self.assertTrue(verifier.verify(_hash, signature.r, signature.s, point),
+                                        f'{signer.name} -> {verifier.name}')
+                        self.assertFalse(verifier.verify(hashes[0] if _hash != hashes[0] else hashes[1],
+                                                         signature.r, signature.s, point))
+                        self.assertEqual(verifier.recover(_hash, signature.r, signature.s, signature.recid),
+                                         (point.x, point.y), f'{signer.name} -> {verifier.name}')
+
+    def test_tweak_add(self):
+        from witnet.crypto.secp256k1.secp256k1 import N
+
+        point = WitPrivateKey.from_int(secrets[2]).to_public().point
+        for name in native:
+            backend = load_backend(name)
+            for tweak in secrets + [0]:
+                self.assertEqual(backend.tweak_add(point, tweak), PYTHON.tweak_add(point, tweak), name)
+            self.assertIsNone(backend.tweak_add(point, N - secrets[2]), name)
+            self.assertEqual(backend.tweak_add_many(point, secrets + [N - secrets[2]]),
+                             [PYTHON.tweak_add(point, tweak) for tweak in secrets] + [None], name)
+            self.assertEqual(backend.public_key_many(secrets), PYTHON.public_key_many(secrets), name)
+
+    def test_deterministic_der(self):
+        for secret in secrets:
+            key = WitPrivateKey.from_int(secret)
+            for _hash in hashes:
+                expected = sign(PYTHON, secret, _hash, key.nonce_generator().nonces(_hash))
+                for name in native:
+                    signature = sign(load_backend(name), secret, _hash, key.nonce_generator().nonces(_hash))
+                    self.assertEqual(signature.encode(), expected.encode(), name)
+                    self.assertEqual(signature.recid, expected.recid, name)
+
+
+@unittest.skipUnless('cryptography' in native, 'cryptography is not installed')
+class TestCryptographyBackend(unittest.TestCase):
+
+    def test_verify_only(self):
+        # OpenSSL is only faster for verification, key generation and signing stay on the generator table
+        backend = load_backend('cryptography')
+        for method in ('public_key', 'public_key_many', 'sign', 'tweak_add', 'recover'):
+            self.assertIs(getattr(type(backend), method), getattr(PythonBackend, method), method)
+        key = WitPrivateKey.from_int(secrets[2])
+        signature = sign(backend, secrets[2], hashes[1], key.nonce_generator().nonces(hashes[1]))
+        self.assertTrue(backend.verify(hashes[1], signature.r, signature.s, key.to_public().point))
+
+
+class TestInvalidKeys(unittest.TestCase):
+
+    def test_unreduced_point(self):
+        # x = 1 + P is the point with x = 1 mod P, libsecp256k1 refuses to parse it
+        from witnet.crypto.secp256k1.secp256k1 import CURVE, P, Point
+
+        key = WitPrivateKey.from_int(secrets[2])
+        signature = sign(PYTHON, secrets[2], hashes[1], key.nonce_generator().nonces(hashes[1]))
+        y = pow(CURVE.f(1), (P + 1) // 4, P)
+        bad = Point(1 + P, y, curve=CURVE, validate=False)
+        for name in available_backends():
+            backend = load_backend(name)
+            self.assertFalse(backend.verify(hashes[1], signature.r, signature.s, bad), name)
+            self.assertEqual(backend.verify_many([(hashes[1], signature.r, signature.s, key.to_public().point),
+                                                  (hashes[1], signature.r, signature.s, bad)]), [True, False], name)
+
+
+class TestLadderBackend(unittest.TestCase):
+
+    def test_ladder_backend(self):
+        ladder = load_backend('python-ladder')
+        for secret in secrets:
+            self.assertEqual(ladder.public_key(secret), PYTHON.public_key(secret))
+        self.assertEqual(ladder.public_key_many(secrets), [PYTHON.public_key(secret) for secret in secrets])
+        for secret in secrets:
+            key = WitPrivateKey.from_int(secret)
+            for _hash in hashes:
+                self.assertEqual(ladder.sign(secret, _hash, key.nonce_generator().nonces(_hash)),
+                                 PYTHON.sign(secret, _hash, key.nonce_generator().nonces(_hash)))
@@ -0,0 +1,50 @@
+import unittest
+
+from witnet.schema.public_key_hash import PublicKeyHash
+from witnet.util.bech32 import Bech32DecodeError, bech32_decode, decode_many, encode_many
+from witnet.util.bech32.bech32 import Bech32Encoding, encode
+
+# https://github.com/bitcoin/bips/blob/master/bip-0173.mediawiki#test-vectors
+valid = [
+    'A12UEL5L',
+    'a12uel5l',
+    'an83characterlonghumanreadablepartthatcontainsthenumber1andtheexcludedcharactersbio1tt5tgs',
+    'abcdef1qpzry9x8gf2tvdw0s3jn54khce6mua7lmqqqxw',
+    'split1checkupstagehandshakeupstreamerranterredcaperred2y9e3w',
+]
+invalid = [
+    'pzry9x0s0muk',  # no separator character
+    '1pzry9x0s0muk',  # empty HRP
+    'x1b4n0q5v',  # invalid data character
+    'li1dgmt3',  # too short checksum
+    'A1G7SGD8',  # checksum calculated with uppercase form of HRP
+    'a12UEL5L',  # mixed case
+    ' 1nwldj5',  # HRP character out of range
+]
+
+
+class TestBech32(unittest.TestCase):
+
+    def test_vectors(self):
+        for bech in valid:
+            hrp, data = bech32_decode(bech)
+            self.assertEqual(hrp, bech[:bech.rfind('1')].lower())
+        for bech in invalid:
+            with self.assertRaises(Bech32DecodeError, msg=bech):
+                bech32_decode(bech)
+        # https://github.com/bitcoin/bips/blob/master/bip-0350.mediawiki#test-vectors-for-bech32m
+        self.assertEqual(bech32_decode('abcdef1l7aum6echk45nj3s0wdvt2fg8x9yrzpqzd3ryx', Bech32Encoding.BECH32M)[0],
+                         'abcdef')
+        self.assertEqual(encode('bc', 0, bytes.fromhex('751e76e8199196d454941c45d1b3a323f1433bd6')),
+                         'bc1qw508d6qejxtdg4y5r3zarvary0c5xw7kv8f3t4')
+
+    def test_many(self):
+        payloads = [bytes(range(i, i + 20)) for i in range(50)]
+        addresses = encode_many('wit', payloads)
+        self.assertEqual(addresses, [PublicKeyHash(hash=payload).to_address() for payload in payloads])
+        self.assertEqual(decode_many(addresses, hrp='wit'), payloads)
+        self.assertEqual([PublicKeyHash.from_address(address).hash for address in addresses], payloads)
+        with self.assertRaises(Bech32DecodeError):
+            decode_many(addresses, hrp='twit')
+        with self.assertRaises(Bech32DecodeError):
+            decode_many([addresses[0][:-1] + ('q' if addresses[0][-1] != 'q' else 'p')])
@@ -0,0 +1,78 @@
+import os
+import tempfile
+import unittest
+
+from witnet.crypto.hd_wallet.extended_private_key import Xprv
+from witnet.witnet.address import pubkey_to_address
+from witnet.witnet.address.discovery import AddressScanner
+
+account = Xprv.from_seed('000102030405060708090a0b0c0d0e0f').derive_path('m/3h/4919h/0h')
+
+
+class FakeNode:
+    """Stands in for a node connection, `funded` maps addresses to their UTXOs"""
+
+    def __init__(self, funded, queries):
+        self.funded = funded
+        self.queries = queries
+
+    def get_utxo_info(self, address):
+        self.queries.append(address)
+        return self.funded.get(address, [])
+
+    def close(self):
+        pass
+
+
+def address(keychain, index):
+    return pubkey_to_address((account / keychain / index).public_key())
+
+
+class TestDiscovery(unittest.TestCase):
+
+    def scanner(self, funded, **kwargs):
+        queries = []
+        scanner = AddressScanner(account.to_xpub(), connect=lambda: FakeNode(funded, queries), **kwargs)
+        return scanner, queries
+
+    def test_gap_limit(self):
+        funded = {address(0, 2): [{'value': 1}], address(0, 9): [{'value': 2}], address(1, 0): [{'value': 3}]}
+        scanner, queries = self.scanner(funded, gap_limit=7, batch_size=4, connections=2)
+        found = scanner.scan()
+        self.assertEqual([(a.keychain, a.index, a.utxos) for a in found],
+                         [(0, 2, [{'value': 1}]), (0, 9, [{'value': 2}]), (1, 0, [{'value': 3}])])
+        self.assertEqual(found[0].address, address(0, 2))
+        # external: 0..19 (7 unused after 9 by the end of the batch), internal: 0..7
+        self.assertEqual(len(queries), 20 + 8)
+        self.assertEqual(scanner.used_addresses(0), {2: address(0, 2), 9: address(0, 9)})
+
+        # 3..7 are unused, so 9 is beyond the gap
+        scanner, queries = self.scanner(funded, gap_limit=5, batch_size=4)
+        self.assertEqual([a.index for a in scanner.scan(keychains=[0])], [2])
+        self.assertEqual(len(queries), 8)
+
+    def test_gap_limit_batch_size(self):
+        # 3..7 are unused, so 10 is past the gap even when it is queried in the same batch as 2
+        funded = {address(0, 2): [{'value': 1}], address(0, 10): [{'value': 2}]}
+        for batch_size in (1, 3, 4, 6, 11, 20):
+            with self.subTest(batch_size=batch_size):
+                scanner, _ = self.scanner(funded, gap_limit=5, batch_size=batch_size)
+                self.assertEqual([a.index for a in scanner.scan(keychains=[0])], [2])
+                self.assertEqual(scanner.used_addresses(0), {2: address(0, 2)})
+
+    def test_incremental(self):
+        funded = {address(0, 1): [{'value': 1}]}
+        with tempfile.TemporaryDirectory() as tmp:
+            state_file = os.path.join(tmp, 'scan.json')
+            scanner, queries = self.scanner(funded, gap_limit=3, batch_size=3, state_file=state_file)
+            self.assertEqual([a.index for a in scanner.scan(keychains=[0])], [1])
+            self.assertEqual(len(queries), 6)
+
+            funded[address(0, 4)] = [{'value': 2}]
+            scanner, queries = self.scanner(funded, gap_limit=3, batch_size=3, state_file=state_file)
+            self.assertEqual([a.index for a in scanner.scan(keychains=[0])], [4])
+            self.assertEqual(queries[:3], [address(0, i) for i in range(2, 5)])  # resumes after the last used one
+            self.assertEqual(scanner.used_addresses(0), {1: address(0, 1), 4: address(0, 4)})
+
+            with self.assertRaises(AssertionError):
+                AddressScanner((account // 1).to_xpub(), state_file=state_file)
@@ -1,11 +1,25 @@
 import unittest
+from unittest import mock
 
+from witnet.crypto.hd_wallet.derivation import derive_range, wallets_from_mnemonics
 from witnet.crypto.hd_wallet.extended_private_key import Xprv
+from witnet.crypto.secp256k1 import WitPrivateKey
+from witnet.witnet.exceptions import KeyDerivationError
 
 
 xprv_str = 'xprv1qpujxsyd4hfu0dtwa524vac84e09mjsgnh5h9crl8wrqg58z5wmsuqqcxlqmar3fjhkprndzkpnp2xlze76g4hu7g7c4r4r2m2e6y8xlvu566tn6'
 mnemonic = 'abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about'
 
+# https://github.com/bitcoin/bips/blob/master/bip-0032.mediawiki#test-vector-1
+seed = '000102030405060708090a0b0c0d0e0f'
+vectors = {
+    'm/0h': ('edb2e14f9ee77d26dd93b4ecede8d16ed408ce149b6cd80b0715a2d911a0afea',
+             '035a784662a4a20a65bf6aab9ae98a6c068a81c52e4b032c0fb5400c706cfccc56'),
+    'm/0h/1': ('3c6cb8d0f6a264c91ea8b5030fadaa8e538b020f0a387421a12de9319dc93368',
+               '03501e454bf00751f24b1b489aa925215d66af2234e3891c3b21a52bedb3cd711c'),
+    'm/0h/1/2h': ('cbce0d719ecf7431d88e6a89fa1483e02e35092af60c042b1df2ff59fa424dca',
+                  '0357bfe1e341d01c69fe5654309956cbea516822fba8a601743a012a7896ee8dc2'),
+}
 
 
 class TestKeys(unittest.TestCase):
@@ -23,3 +37,94 @@ class TestKeys(unittest.TestCase):
 
     def wallet_from_xprv(self):
         ...
+
+    def test_child(self):
+        master = Xprv.from_seed(seed)
+        self.assertEqual(master.fingerprint().hex(), '3442193e')
+        keys = {'m/0h': master // 0}
+        keys['m/0h/1'] = keys['m/0h'] / 1
+        keys['m/0h/1/2h'] = keys['m/0h/1'] // 2
+        for path, (private_key, public_key) in vectors.items():
+            self.assertEqual(keys[path].path, path)
+            self.assertEqual(keys[path].key.hex(), private_key)
+            self.assertEqual(keys[path].key.to_public().hex(), public_key)
+        self.assertEqual(keys['m/0h'].to_xpub().child(1).key.hex(), vectors['m/0h/1'][1])
+        xpub = keys['m/0h/1'].to_xpub()
+        self.assertEqual(xpub.child(2).key.hex(), (keys['m/0h/1'] / 2).key.to_public().hex())
+        self.assertEqual(xpub.child(2).parent, keys['m/0h/1'].fingerprint())
+        children = xpub.children(range(5))
+        self.assertEqual([child.path for child in children], [f'M/0h/1/{i}' for i in range(5)])
+        self.assertEqual([child.key for child in children], [xpub.child(i).key for i in range(5)])
+        self.assertEqual([child.code for child in children], [xpub.child(i).code for i in range(5)])
+        with self.assertRaises(KeyDerivationError):
+            xpub.children([0, 1 << 31])
+
+    def test_cached_public_data(self):
+        master = Xprv.from_seed(seed)
+        self.assertEqual(master.public_keydata(), master.key.to_public().encode(compressed=True))
+        expected = [master.child(i).key.to_public() for i in range(3)]
+        with mock.patch.object(WitPrivateKey, 'to_public', autospec=True,
+                               side_effect=WitPrivateKey.to_public) as to_public:
+            children = [master.child(i) for i in range(3)]
+            self.assertEqual([child.parent for child in children], [master.fingerprint()] * 3)
+            self.assertEqual(master.to_xpub().fingerprint(), master.fingerprint())
+            self.assertEqual(master.to_xpub().key, master.public_key())
+            self.assertEqual([child.public_key() for child in master.children(range(3))], expected)
+            self.assertEqual(to_public.call_count, 0)
+
+    def test_derive_range(self):
+        account = Xprv.from_seed(seed) // 0
+        expected = [account.child(i).key.to_public() for i in range(8)]
+        for parent in (account, account.to_xpub()):
+            for kwargs in ({}, {'processes': 2, 'pool_threshold': 1, 'chunk_size': 3}):
+                derived = list(derive_range(parent, 0, 8, **kwargs))
+                self.assertEqual([d.index for d in derived], list(range(8)))
+                self.assertEqual([d.public_key for d in derived], [key.encode() for key in expected])
+                self.assertEqual([d.address for d in derived], [key.to_address() for key in expected])
+                self.assertEqual([d.pkh for d in derived], [key.to_pkh() for key in expected])
+                self.assertTrue(all(d.address.startswith('wit1') for d in derived))
+
+        hardened = list(derive_range(account, 2, 1, hardened=True))
+        self.assertEqual(hardened[0].public_key.hex(), (account // 2).key.to_public().hex())
+        with self.assertRaises(KeyDerivationError):
+            list(derive_range(account.to_xpub(), 0, 1, hardened=True))
+
+    def test_derive_path(self):
+        master = Xprv.from_seed(seed)
+        for path, (private_key, _) in vectors.items():
+            self.assertEqual(master.derive_path(path).key.hex(), private_key)
+        self.assertEqual(master.derive_path("m/0'/1").path, 'm/0h/1')
+        self.assertEqual((master // 0).derive_path('1/2h').key.hex(), vectors['m/0h/1/2h'][0])
+        self.assertEqual(master.to_xpub().derive_path('M/0/1').key, (master / 0 / 1).key.to_public())
+        with self.assertRaises(AssertionError):
+            (master // 0).derive_path('m/0h')
+        with self.assertRaises(KeyDerivationError):
+            master.to_xpub().derive_path('M/0h')
+
+        # siblings only derive the last level
+        master.derivation_cache_clear()
+        master.derive_path('m/3h/4919h/0h/0/0')
+        expected = [(master // 3 // 4919 // 0 / 0 / i).key.hex() for i in range(1, 4)]
+        with mock.patch.object(Xprv, 'child', autospec=True, side_effect=Xprv.child) as child:
+            for i in range(1, 4):
+                key = master.derive_path(f'm/3h/4919h/0h/0/{i}')
+                self.assertEqual(key.path, f'm/3h/4919h/0h/0/{i}')
+                self.assertEqual(key.key.hex(), expected[i - 1])
+            self.assertEqual(child.call_count, 3)
+
+        # the cache belongs to the key it is called on, `/` and `//` always derive
+        with mock.patch.object(Xprv, 'child', autospec=True, side_effect=Xprv.child) as child:
+            Xprv.from_seed(seed).derive_path('m/3h/4919h/0h/0/1')
+            master // 3
+            self.assertEqual(child.call_count, 6)
+
+    def test_wallets_from_mnemonics(self):
+        wallets = list(wallets_from_mnemonics([mnemonic, mnemonic], ['', 'TREZOR'], addresses=3))
+        self.assertEqual([wallet.phrase_id for wallet in wallets], [0, 1])
+        for wallet, passphrase in zip(wallets, ['', 'TREZOR']):
+            master = Xprv.from_mnemonic(mnemonic, passphrase)
+            self.assertEqual(wallet.master.key.hex(), master.key.hex())
+            self.assertEqual([a.address for a in wallet.addresses],
+                             [master.derive_path(f'm/3h/4919h/0h/0/{i}').address() for i in range(3)])
+        self.assertEqual(next(wallets_from_mnemonics([mnemonic])).addresses, [])
+        self.assertFalse(wallets[0].master._derivation_cache)
@@ -1,8 +1,9 @@
 import json
 import random
 import unittest
+from unittest import mock
 
-from witnet.crypto.bip39.mnemonic import Mnemonic
+from witnet.crypto.bip39.mnemonic import Mnemonic, get_wordlist
 
 
 class TestMnemonic(unittest.TestCase):
@@ -17,6 +18,40 @@ class TestMnemonic(unittest.TestCase):
             self.assertEqual(v[2], seed.hex())
             self.assertEqual(v[3], xprv)
 
+    def test_vectors(self):
+        # https://github.com/trezor/python-mnemonic/blob/master/vectors.json
+        vectors = [
+            ("00" * 16, " ".join(["abandon"] * 11 + ["about"])),
+            ("7f" * 16, "legal winner thank year wave sausage worth useful legal winner thank yellow"),
+            ("80" * 16, "letter advice cage absurd amount doctor acoustic avoid letter advice cage above"),
+            ("ff" * 16, " ".join(["zoo"] * 11 + ["wrong"])),
+            ("00" * 32, " ".join(["abandon"] * 23 + ["art"])),
+            ("ff" * 32, " ".join(["zoo"] * 23 + ["vote"])),
+        ]
+        m = Mnemonic("english")
+        for entropy, code in vectors:
+            self.assertEqual(m.to_mnemonic(bytes.fromhex(entropy)), code)
+            self.assertEqual(m.to_entropy(code).hex(), entropy)
+            self.assertTrue(m.check(code))
+        with self.assertRaises(ValueError):
+            m.to_entropy(" ".join(["abandon"] * 12))
+        with self.assertRaises(LookupError):
+            m.to_entropy(" ".join(["abandon"] * 11 + ["xxx"]))
+        self.assertFalse(m.check(" ".join(["abandon"] * 11 + ["xxx"])))
+
+    def test_to_seed_many(self):
+        m = Mnemonic("english")
+        codes = [m.to_mnemonic(bytes([i]) * 16) for i in range(20)]
+        passphrases = [f"pass{i}" for i in range(20)]
+        expected = [Mnemonic.to_seed(code, passphrase) for code, passphrase in zip(codes, passphrases)]
+
+        self.assertEqual(list(Mnemonic.to_seed_many(codes[:3], passphrases[:3])), list(enumerate(expected[:3])))
+        self.assertEqual(dict(Mnemonic.to_seed_many(codes[:2])), {i: Mnemonic.to_seed(codes[i]) for i in range(2)})
+        pooled = Mnemonic.to_seed_many(codes, passphrases, processes=2, chunk_size=3, pool_threshold=1)
+        self.assertEqual(sorted(pooled), list(enumerate(expected)))
+        with self.assertRaises(AssertionError):
+            list(Mnemonic.to_seed_many(codes, passphrases[:3]))
+
     def test_failed_checksum(self):
         code = "bless cloud wheel regular tiny venue bird web grief security dignity zoo"
         mnemo = Mnemonic("english")
@@ -27,6 +62,21 @@ class TestMnemonic(unittest.TestCase):
         with self.assertRaises(Exception):
             Mnemonic.detect_language("xxxxxxx")
 
+    def test_shared_wordlists(self):
+        # "abandon", "animal" and "brave" are in both the english and the french wordlist
+        self.assertEqual("french", Mnemonic.detect_language("abandon animal brave abeille"))
+        self.assertEqual("english", Mnemonic.detect_language("abandon animal brave about"))
+
+        code = Mnemonic("english").to_mnemonic(bytes(16))
+        self.assertIs(Mnemonic("english").wordlist, get_wordlist("english").words)
+        with mock.patch('builtins.open', side_effect=AssertionError('file read')), \
+                mock.patch('os.listdir', side_effect=AssertionError('directory listed')):
+            m = Mnemonic("english")
+            self.assertEqual(Mnemonic.detect_language(code), "english")
+            self.assertEqual(m.to_entropy(code), bytes(16))
+            self.assertTrue(m.check(code))
+            self.assertEqual(Mnemonic("french").wordlist[Mnemonic("french").index["abeille"]], "abeille")
+
     def test_utf8_nfkd(self):
         # The same sentence in various UTF-8 forms
         words_nfkd = u"Pr\u030ci\u0301s\u030cerne\u030c z\u030clut\u030couc\u030cky\u0301 ku\u030an\u030c " \
@@ -78,3 +128,13 @@ class TestMnemonic(unittest.TestCase):
         m = Mnemonic("english")
         self.assertEqual("access", m.expand("access"))
         self.assertEqual("access access acb acc act action", m.expand("access acce acb acc act acti"))
+
+    def test_expand_many(self):
+        m = Mnemonic("english")
+        self.assertEqual(m.expand_many(["acce acti", "zo zoo wro", ""]), ["access action", "zo zoo wrong", ""])
+        for language in Mnemonic.list_languages():
+            m = Mnemonic(language)
+            for word in random.sample(m.wordlist, 64):
+                for prefix in (word[:2], word[:4]):
+                    matches = [w for w in m.wordlist if w.startswith(prefix)]
+                    self.assertEqual(m.expand_word(prefix), matches[0] if len(matches) == 1 else prefix, language)
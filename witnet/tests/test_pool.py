@@ -0,0 +1,31 @@
+import unittest
+
+from witnet.util.pool import chunked, pool_map, pool_processes
+
+
+class TestPool(unittest.TestCase):
+
+    def test_pool_processes(self):
+        self.assertEqual(pool_processes(3, 10, 10), 3)
+        self.assertEqual(pool_processes(3, 9, 10), 1)
+        self.assertGreaterEqual(pool_processes(None, 10, 1), 1)
+
+    def test_chunked(self):
+        self.assertEqual(list(chunked([1, 2, 3, 4, 5], 2)), [[1, 2], [3, 4], [5]])
+        self.assertEqual(list(chunked(range(3, 10), 3)), [range(3, 6), range(6, 9), range(9, 10)])
+        self.assertEqual(list(chunked([], 2)), [])
+
+    def test_pool_map(self):
+        consumed = []
+
+        def tasks():
+            for i in range(20):
+                consumed.append(i)
+                yield 2, i
+
+        results = pool_map(pow, tasks(), 2)
+        self.assertEqual(next(results), 1)
+        self.assertLessEqual(len(consumed), 5)  # 2 * processes in flight, plus the one refilled
+        self.assertEqual(list(results), [2 ** i for i in range(1, 20)])
+        self.assertEqual(sorted(pool_map(pow, [(2, i) for i in range(20)], 2, ordered=False)),
+                         [2 ** i for i in range(20)])
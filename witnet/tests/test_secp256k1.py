@@ -0,0 +1,127 @@
+import unittest
+
+from witnet.crypto import number_theory as nt
+from witnet.crypto.secp256k1 import CURVE, WitPrivateKey, WitPublicKey
+from witnet.crypto.secp256k1.secp256k1 import N, P, Point, wnaf
+
+# https://crypto.stackexchange.com/questions/784/are-there-any-secp256k1-ecdsa-test-examples-available
+multiples = {
+    2: (0xC6047F9441ED7D6D3045406E95C07CD85C778E4B8CEF3CA7ABAC09B95C709EE5,
+        0x1AE168FEA63DC339A3C58419466CEAEEF7F632653266D0E1236431A950CFE52A),
+    3: (0xF9308A019258C31049344F85F89D5229B531C845836F99B08601F113BCE036F9,
+        0x388F7B0F632DE8140FE337E62A37F3566500A99934C2231B6CB9FD7584B8E672),
+    20: (0x4CE119C96E2FA357200B559B2F7DD5A5F02D5290AFF74B03F3E471B273211C97,
+         0x12BA26DCB10EC1625DA61FA10A844C676162948271D96967450288EE9233DC3A),
+    112233445566778899: (0xA90CC3D3F3E146DAADFC74CA1372207CB4B725AE708CEF713A98EDD73D99EF29,
+                         0x5A79D6B289610C68BC3B47F3D72F9788A26A06868B4D8E433E1E2AD76FB7DC76),
+}
+
+
+class TestCurve(unittest.TestCase):
+
+    def test_point_mul(self):
+        for k, (x, y) in multiples.items():
+            self.assertEqual(CURVE.generator * k, Point(x, y, curve=CURVE))
+
+    def test_point_add(self):
+        g = CURVE.generator
+        self.assertEqual(g + g, g * 2)
+        self.assertEqual(g * 2 + g, g * 3)
+        self.assertEqual(g * 20 - g * 17, g * 3)
+
+    def test_point_at_infinity(self):
+        g = CURVE.generator
+        self.assertIsNone(g * 0)
+        self.assertIsNone(g * N)
+        self.assertIsNone(g + g * (N - 1))
+        self.assertEqual(g * (N - 1), g * -1)
+
+    def test_generator_table(self):
+        g = CURVE.generator
+        g2 = g * 2  # not the generator, so this takes the generic multiplication path
+        for k in (1, 2, 63, 64, 2 ** 255 + 1, N - 2, 112233445566778899):
+            self.assertEqual(g * (2 * k), g2 * k)
+
+    def test_wnaf(self):
+        for d in (1, 7, 2 ** 255 + 1, N - 1, 112233445566778899):
+            digits = wnaf(d, w=5)
+            self.assertEqual(sum(digit << i for i, digit in enumerate(digits)), d)
+            for i, digit in enumerate(digits):
+                if digit:
+                    self.assertEqual(digit % 2, 1)
+                    self.assertLess(abs(digit), 16)
+                    self.assertFalse(any(digits[i + 1:i + 5]))
+
+    def test_multi_mul(self):
+        g = CURVE.generator
+        p, q = g * 3, g * 112233445566778899
+        self.assertEqual(CURVE.multi_mul([(g, 5), (p, 7)]), g * 26)
+        self.assertEqual(CURVE.multi_mul([(g, 5), (p, 7), (q, N - 1), (g, 2)]), g * 28 - q)
+        self.assertIsNone(CURVE.multi_mul([(g, 3), (p, N - 1)]))
+        self.assertIsNone(CURVE.multi_mul([]))
+
+    def test_generator_mul_many(self):
+        g = CURVE.generator
+        p = g * 3
+        self.assertEqual(CURVE.generator_mul_many(list(multiples)), [Point(x, y) for x, y in multiples.values()])
+        self.assertEqual(CURVE.generator_mul_many([0, 2, N - 3, 17], offset=p), [p, g * 5, None, g * 20])
+        self.assertEqual(CURVE.generator_mul_many([]), [])
+
+    def test_point_validation(self):
+        x, y = multiples[2]
+        self.assertFalse(hasattr(Point(x, y), '__dict__'))
+        self.assertIs(Point(x, y).curve, CURVE)
+        with self.assertRaises(AssertionError):
+            Point(x, y + 1)
+        self.assertEqual(Point(x, y + 1, validate=False).y, y + 1)
+
+    def test_decode(self):
+        for k in multiples:
+            public_key = WitPrivateKey.from_int(k).to_public()
+            compressed, uncompressed = public_key.encode(compressed=True), public_key.encode(compressed=False)
+            self.assertEqual(WitPublicKey.decode(compressed), public_key)
+            self.assertEqual(WitPublicKey.decode(uncompressed), public_key)
+            self.assertIs(WitPublicKey.decode(compressed).point, WitPublicKey.decode(compressed).point)
+
+        x, y = multiples[2]
+        root = pow(CURVE.f(1), (P + 1) // 4, P)
+        self.assertEqual(root * root % P, CURVE.f(1))
+        for key in (b'\x04' + x.to_bytes(32, 'big') + (y + 1).to_bytes(32, 'big'),  # not in curve
+                    b'\x04' + (1 + P).to_bytes(32, 'big') + root.to_bytes(32, 'big'),  # x = 1 mod P, not reduced
+                    b'\x02' + (5).to_bytes(32, 'big'),  # 5^3 + 7 is not a square
+                    b'\x05' + x.to_bytes(32, 'big'),
+                    b'\x02' + x.to_bytes(32, 'big')[1:]):
+            with self.assertRaises(AssertionError):
+                WitPublicKey.decode(key)
+
+    def test_ladder_mul(self):
+        g = CURVE.generator
+        p = g * 3
+        for k in (1, 2, 3, 2 ** 128, 2 ** 255 + 1, N - 1, 112233445566778899):
+            self.assertEqual(CURVE.ladder_mul(g, k), g * k)
+            self.assertEqual(CURVE.ladder_mul(p, k), p * k)
+        self.assertIsNone(CURVE.ladder_mul(g, 0))
+        self.assertIsNone(CURVE.ladder_mul(g, N))
+
+    def test_mulinv(self):
+        values = [1, 2, 3, N - 1, 112233445566778899]
+        for value in values:
+            for algo in (None, nt.xgcd, nt.egcd):
+                self.assertEqual(value * nt.mulinv(value, N, algo=algo) % N, 1)
+        self.assertEqual(nt.batch_mulinv(values, N), [nt.mulinv(value, N) for value in values])
+        self.assertEqual(nt.batch_mulinv([], N), [])
+        with self.assertRaises(AssertionError):
+            nt.mulinv(N, N)
+
+    def test_modsqrt(self):
+        self.assertIn(P, nt.KNOWN_PRIMES)
+        self.assertIn(N, nt.KNOWN_PRIMES)
+        # P = 3 (mod 4) takes the shortcut, 2^255 - 19 = 1 (mod 4) goes through Tonelli-Shanks
+        for p in (P, 2 ** 255 - 19, 13, 17):
+            for a in (2, 3, 4, 5, 7, 10):
+                root = nt.modsqrt(a, p)
+                if nt.legendre(a, p) == 1:
+                    self.assertEqual(root * root % p, a % p)
+                else:
+                    self.assertEqual(root, 0)
+        self.assertEqual(nt.tonelli_shanks_parameters(17)[:2], (1, 4))
@@ -1,8 +1,8 @@
 import unittest
 
-from witnet.crypto.secp256k1 import Signature
-from witnet.crypto.secp256k1 import WitPublicKey, WitPrivateKey
-from witnet.util.transformations import hex_to_bytes, int_to_hex, concat
+from witnet.crypto.secp256k1 import Signature, available_backends, get_backend, set_backend
+from witnet.crypto.secp256k1 import WitPublicKey, WitPrivateKey, recover_public_key, verify_batch
+from witnet.util.transformations import hex_to_bytes, int_to_hex, concat, sha256
 
 
 class TestSignature(unittest.TestCase):
@@ -22,3 +22,73 @@ class TestSignature(unittest.TestCase):
 
         assert local_signature.verify_hash(data, public_key)
         assert recovered_signature.verify_hash(data, public_key)
+        assert local_signature == recovered_signature  # RFC 6979 nonce
+
+    def test_deterministic_nonce(self):
+        # https://github.com/trezor/trezor-crypto/blob/master/tests/test_check.c
+        secret_key = WitPrivateKey.from_int(1)
+        data = sha256(b'Satoshi Nakamoto')
+        backend = get_backend()
+        nonce = next(secret_key.nonce_generator().nonces(data))
+        self.assertEqual(nonce, 0x8F8A276C19F4149656B280621E358CCE24F5F52542772691EE69063B74F15D15)
+        self.assertEqual(secret_key.sign_hash(data).hex(),
+                         '3045022100934b1ea10a4b3c1757e2b0c017d0b6143ce3c9a7e6a4a49860d7a6ab210ee3d8'
+                         '02202442ce9d2b916064108014783e923ec36b49743e2ffa1c4496f01a512aafd9e5')
+        self.assertEqual(secret_key.sign_hash(data), secret_key.sign_hash(data))
+        self.assertTrue(secret_key.sign_hash(data, deterministic=False).verify_hash(data, secret_key.to_public()))
+
+        # every backend has to honour deterministic=False
+        for name in available_backends() + ['python-ladder']:
+            with self.subTest(backend=name):
+                set_backend(name)
+                try:
+                    first, second = (secret_key.sign_hash(data, deterministic=False) for _ in range(2))
+                    self.assertNotEqual(first.encode(), second.encode())
+                    self.assertNotEqual(first.encode(), secret_key.sign_hash(data).encode())
+                    self.assertTrue(first.verify_hash(data, secret_key.to_public()))
+                finally:
+                    set_backend(backend.name)
+
+    def test_verify_batch(self):
+        keys = [WitPrivateKey.from_hex(concat([b for _ in range(32)])) for b in ('01', 'cd', 'ef')]
+        hashes = [hex_to_bytes(concat([b for _ in range(32)])) for b in ('ab', '12')]
+        items = [(h, key.sign_hash(h), key.to_public()) for key in keys for h in hashes]
+        expected = [True] * len(items)
+
+        # wrong key, wrong hash, DER encoded signature, encoded key, undecodable signature
+        items.append((hashes[0], items[0][1], keys[1].to_public()))
+        items.append((hashes[1], items[0][1], keys[0].to_public()))
+        items.append((hashes[0], items[0][1].encode(), keys[0].to_public().encode()))
+        items.append((hashes[0], b'\x30\x00', keys[0].to_public()))
+        expected += [False, False, True, False]
+
+        self.assertEqual(verify_batch(items), expected)
+        self.assertEqual(verify_batch(items, processes=2, pool_threshold=1), expected)
+
+    def test_recover_public_key(self):
+        for secret in (1, 2, 0xcd * (2 ** 256 - 1) // 0xff):
+            secret_key = WitPrivateKey.from_int(secret)
+            for data in (sha256(b'Satoshi Nakamoto'), hex_to_bytes(concat(['ab' for _ in range(32)]))):
+                signature = secret_key.sign_hash(data)
+                recovered = recover_public_key(data, signature)
+                self.assertEqual(recovered, secret_key.to_public())
+                self.assertEqual(recovered.to_pkh(), secret_key.to_public().to_pkh())
+                self.assertNotEqual(recover_public_key(data, signature, signature.recid ^ 1), recovered)
+                # DER does not carry the recovery id, so it has to be passed in
+                self.assertEqual(recover_public_key(data, Signature.decode(signature.encode()), signature.recid),
+                                 recovered)
+                with self.assertRaisesRegex(AssertionError, 'no recovery id'):
+                    recover_public_key(data, Signature.decode(signature.encode()))
+
+    def test_recover_keeps_decode_cache(self):
+        # nonce points are one-off, they must not take the place of signer keys in the decode cache
+        from witnet.crypto.secp256k1.backends import PYTHON
+        from witnet.crypto.secp256k1.secp256k1 import decode_point
+
+        secret_key = WitPrivateKey.from_int(0xcd * (2 ** 256 - 1) // 0xff)
+        signatures = [(sha256(bytes([i])), secret_key.sign_hash(sha256(bytes([i])))) for i in range(8)]
+        before = decode_point.cache_info().currsize
+        for data, signature in signatures:
+            self.assertEqual(PYTHON.recover(data, signature.r, signature.s, signature.recid),
+                             (secret_key.to_public().point.x, secret_key.to_public().point.y))
+        self.assertEqual(decode_point.cache_info().currsize, before)
@@ -0,0 +1,45 @@
+import subprocess
+import sys
+import unittest
+from typing import Dict, Tuple
+
+# Generous upper bound (in microseconds) for the cumulative import time of a lightweight module, the point is to
+# catch heavy packages sneaking back in at import time rather than to measure the machine
+STARTUP_BUDGET = 500_000
+
+# Packages that the crypto and address code must not load at import time
+HEAVY_MODULES = ['witnet.schema', 'witnet.rad', 'cbor', 'concurrent.futures']
+
+
+def importtime(module: str) -> Tuple[Dict[str, int], str]:
+    """Cumulative import time of every module loaded by `import module`, from `python -X importtime`"""
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                             capture_output=True, text=True, check=True)
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        times[name.strip()] = int(cumulative)
+    return times, process.stdout
+
+
+class TestStartup(unittest.TestCase):
+
+    def check_startup(self, module):
+        times, output = importtime(module)
+        self.assertEqual(output, '', f'importing {module} printed output')
+        for heavy in HEAVY_MODULES:
+            self.assertNotIn(heavy, times, f'importing {module} imported {heavy}')
+        self.assertLess(times[module], STARTUP_BUDGET)
+
+    def test_secp256k1(self):
+        self.check_startup('witnet.crypto.secp256k1')
+
+    def test_number_theory(self):
+        self.check_startup('witnet.crypto.number_theory')
+        import witnet.crypto.number_theory  # noqa: F401
+        self.assertLess(sys.getrecursionlimit(), 1_000_000)
+
+    def test_address(self):
+        self.check_startup('witnet.witnet.address')
@@ -0,0 +1,3 @@
+from witnet.util.bech32.bech32 import Bech32DecodeError, Bech32Encoding, CHARSET
+from witnet.util.bech32.bech32 import bech32_decode, bech32_encode, bech32_decode_address, bech32_encode_address
+from witnet.util.bech32.bech32 import bech32_encode_master_key, encode_many, decode_many
@@ -1,32 +1,182 @@
-from typing import List
+from enum import Enum
+from functools import lru_cache
+from typing import Iterable, List, Tuple
+
+from witnet.util.transformations.transformations import BaseConversionError, convert_bits
+
+
+class Bech32Encoding(Enum):
+    """Enumeration type to list the various supported encodings."""
+    BECH32 = 1
+    BECH32M = 2
+
+
+class Bech32DecodeError(Exception):
+    pass
+
 
 CHARSET = 'qpzry9x8gf2tvdw0s3jn54khce6mua7l'
 generator = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
 
+# Final checksum constants, https://github.com/bitcoin/bips/blob/master/bip-0350.mediawiki
+BECH32_CONST = {Bech32Encoding.BECH32: 1, Bech32Encoding.BECH32M: 0x2bc830a3}
+
+# XOR of the generator terms selected by each value of the 5 bits shifted out of the checksum,
+# so every character costs one lookup instead of five conditional XORs
+GENERATOR_TABLE = [0] * 32
+for _top in range(32):
+    for _i in range(5):
+        if (_top >> _i) & 1:
+            GENERATOR_TABLE[_top] ^= generator[_i]
+
+# ASCII code point -> 5 bit value of the character (either case), -1 for characters outside the charset
+CHARSET_REV = [-1] * 128
+for _i, _c in enumerate(CHARSET):
+    CHARSET_REV[ord(_c)] = CHARSET_REV[ord(_c.upper())] = _i
+
 
-def bech32_poly_mod(values) -> int:
-    """Internal function that computes the Bech32 checksum."""
-    chk = 1
+def bech32_poly_mod(values, chk: int = 1) -> int:
+    """Internal function that computes the Bech32 checksum, continuing from `chk`."""
+    table = GENERATOR_TABLE
     for value in values:
-        top = chk >> 25
-        chk = (chk & 0x1ffffff) << 5 ^ value
-        for i in range(5):
-            chk ^= generator[i] if ((top >> i) & 1) else 0
+        chk = (chk & 0x1ffffff) << 5 ^ value ^ table[chk >> 25]
     return chk
 
 
+@lru_cache(maxsize=16)
+def _hrp_poly_mod(hrp: str) -> int:
+    """Checksum state after the expanded HRP, the same for every address of a network."""
+    return bech32_poly_mod(bech32_hrp_expand(hrp))
+
+
 def bech32_hrp_expand(hrp: str) -> List[int]:
     """Expand the HRP into values for checksum computation."""
     return [ord(x) >> 5 for x in hrp] + [0] + [ord(x) & 31 for x in hrp]
 
 
-def bech32_verify_checksum(hrp: str, data) -> bool:
+def bech32_verify_checksum(hrp: str, data, spec=Bech32Encoding.BECH32) -> bool:
     """Verify a checksum given HRP and converted data characters."""
-    return bech32_poly_mod(bech32_hrp_expand(hrp) + data) == 1
+    return bech32_poly_mod(data, _hrp_poly_mod(hrp)) == BECH32_CONST[spec]
 
 
-def bech32_create_checksum(hrp: str, data):
+def bech32_create_checksum(hrp: str, data, spec=Bech32Encoding.BECH32) -> List[int]:
     """Compute the checksum values given HRP and data."""
-    values = bech32_hrp_expand(hrp) + data
-    polymod = bech32_poly_mod(values + [0, 0, 0, 0, 0, 0]) ^ 1
+    polymod = bech32_poly_mod(data, _hrp_poly_mod(hrp))
+    polymod = bech32_poly_mod([0, 0, 0, 0, 0, 0], polymod) ^ BECH32_CONST[spec]
     return [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
+
+
+def to_5bit(data: bytes) -> List[int]:
+    """`convert_bits(data, 8, 5, pad=False)` through a single integer instead of a bit accumulator loop"""
+    nbits = len(data) * 8
+    value, leftover = int.from_bytes(data, 'big'), nbits % 5
+    if value & ((1 << leftover) - 1):
+        raise BaseConversionError
+    value >>= leftover
+    return [(value >> shift) & 31 for shift in range(nbits - leftover - 5, -1, -5)]
+
+
+def from_5bit(data: List[int]) -> bytes:
+    """`convert_bits(data, 5, 8, pad=False)` through a single integer"""
+    value = 0
+    for d in data:
+        if d < 0 or d >> 5:
+            raise BaseConversionError
+        value = value << 5 | d
+    leftover = len(data) * 5 % 8
+    if leftover >= 5 or value & ((1 << leftover) - 1):
+        raise BaseConversionError
+    return (value >> leftover).to_bytes(len(data) * 5 // 8, 'big')
+
+
+def bech32_encode(hrp: str, data: List[int], spec=Bech32Encoding.BECH32) -> str:
+    """Encode 5 bit values, appending their checksum."""
+    return hrp + '1' + ''.join([CHARSET[i] for i in data + bech32_create_checksum(hrp, data, spec)])
+
+
+def bech32_decode(bech: str, spec=Bech32Encoding.BECH32) -> Tuple[str, List[int]]:
+    """Split and validate a bech32 string, returning the HRP and the 5 bit values without the checksum."""
+    if any(ord(x) < 33 or ord(x) > 126 for x in bech):
+        raise Bech32DecodeError('Character outside US-ASCII [33-126] range')
+    if (bech.lower() != bech) and (bech.upper() != bech):
+        raise Bech32DecodeError('Mixed upper and lower case')
+    bech = bech.lower()
+    separator = bech.rfind('1')
+    if separator == 0:
+        raise Bech32DecodeError('Empty human readable part')
+    elif separator == -1:
+        raise Bech32DecodeError('No separator character')
+    elif separator + 7 > len(bech):
+        raise Bech32DecodeError('Checksum too short')
+    hrp = bech[:separator]
+    data = [CHARSET_REV[ord(x)] for x in bech[separator + 1:]]
+    if -1 in data:
+        raise Bech32DecodeError('Character not in charset')
+    if not bech32_verify_checksum(hrp, data, spec):
+        raise Bech32DecodeError('Invalid checksum')
+    return hrp, data[:-6]
+
+
+def bech32_decode_address(bech: str):
+    try:
+        _, decoded = bech32_decode(bech)
+        if len(decoded) < 2:
+            raise Bech32DecodeError('Witness program too short')
+    except Bech32DecodeError as error:
+        # best effort: report the problem and convert whatever the data part holds
+        print(error)
+        separator = bech.rfind('1')
+        decoded = [CHARSET_REV[ord(x)] if ord(x) < 128 else -1 for x in bech[separator + 1:]][:-6]
+
+    return convert_bits(decoded, from_bits=5, to_bits=8, pad=True)
+
+
+def bech32_encode_master_key(hrp: str, data: str) -> str:
+    return bech32_encode(hrp, to_5bit(bytes.fromhex(data))[:-1])
+
+
+def bech32_encode_address(hrp: str, data: str) -> str:
+    return bech32_encode(hrp, to_5bit(bytes.fromhex(data)))
+
+
+def encode_many(hrp: str, payloads: Iterable[bytes]) -> List[str]:
+    """`bech32_encode_address` for many payloads (bytes rather than hex strings)"""
+    return [bech32_encode(hrp, to_5bit(payload)) for payload in payloads]
+
+
+def decode_many(addresses: Iterable[str], hrp: str = None) -> List[bytes]:
+    """
+    Payloads of many addresses. Unlike `bech32_decode_address` an invalid address raises Bech32DecodeError,
+    as does an address of another network when `hrp` is given.
+    """
+    payloads = []
+    for address in addresses:
+        hrp_, data = bech32_decode(address)
+        if hrp is not None and hrp_ != hrp:
+            raise Bech32DecodeError(f'Expected human readable part {hrp}, got {hrp_}')
+        payloads.append(from_5bit(data))
+    return payloads
+
+
+def decode(hrp: str, bech: str):
+    bech, separator = bech.lower(), bech.rfind('1')
+    hrp_ = bech[:separator]
+    assert hrp == hrp_
+
+    data = [CHARSET_REV[ord(x)] for x in bech[separator + 1:]]
+    decoded = data[:-6]
+    witness_version = data[0]
+    b32 = ''.join([bin(b)[2:].zfill(5) for b in decoded])
+
+    b256 = [int(b32[i: i + 8], 2) for i in range(0, len(b32), 8)]
+    witness_program = b256
+    return witness_version, witness_program
+
+
+def encode(hrp: str, witver: int, witprog) -> str:
+    """Encode a segwit address."""
+    spec = Bech32Encoding.BECH32 if witver == 0 else Bech32Encoding.BECH32M
+    ret = bech32_encode(hrp, [witver] + convert_bits(witprog, 8, 5), spec)
+    if decode(hrp, ret) == (None, None):
+        return ''
+    return ret
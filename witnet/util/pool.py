@@ -0,0 +1,43 @@
+import itertools
+import os
+from collections import deque
+from typing import Callable, Iterable, Iterator, Optional, Sequence
+
+
+def pool_processes(processes: Optional[int], size: int, pool_threshold: int) -> int:
+    """
+    Number of worker processes for a batch of `size` items: `processes` (defaults to the number of CPUs), or 1, meaning
+    the batch is handled in this process, for batches smaller than `pool_threshold`
+    """
+    processes = processes or os.cpu_count() or 1
+    return 1 if size < pool_threshold else processes
+
+
+def chunked(items: Sequence, size: int) -> Iterator[Sequence]:
+    """Consecutive slices of at most `size` items (ranges slice into ranges)"""
+    return (items[i:i + size] for i in range(0, len(items), size))
+
+
+def pool_map(worker: Callable, tasks: Iterable[tuple], processes: int, ordered=True) -> Iterator:
+    """
+    `worker(*task)` for every task, run by a pool of `processes` worker processes. At most 2 * `processes` tasks are
+    submitted ahead of the results consumed, so `tasks` may be a lazy iterable and the first results come out while
+    later tasks are still queued. Results are yielded in the order of `tasks`, or in the order they are completed
+    when `ordered` is false.
+    """
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    tasks = iter(tasks)
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        pending = deque(executor.submit(worker, *task) for task in itertools.islice(tasks, 2 * processes))
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+            for future in done:
+                for task in itertools.islice(tasks, 1):
+                    pending.append(executor.submit(worker, *task))
+                yield future.result()
@@ -0,0 +1,12 @@
+from witnet.util.transformations import bytes_to_hex, sha256
+from witnet.util.bech32 import bech32_encode_address
+from witnet.witnet.network import network
+
+
+def pubkey_to_pkh(public_key) -> bytes:
+    """Public key hash: the first 20 bytes of the SHA-256 of the compressed public key"""
+    return sha256(public_key.encode(compressed=True))[:20]
+
+
+def pubkey_to_address(public_key) -> str:
+    return bech32_encode_address(hrp=network('HRP'), data=bytes_to_hex(pubkey_to_pkh(public_key)))
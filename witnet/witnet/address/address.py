@@ -2,7 +2,7 @@ from witnet.crypto.secp256k1 import WitPrivateKey, WitPublicKey
 from witnet.schema.public_key import PublicKey
 from witnet.schema import VTTransaction
 from witnet.util.transformations import wit_to_nano_wit, nano_wit_to_wit, sha256
-from witnet.util.transformations.bech32 import bech32_decode_address
+from witnet.util.bech32 import bech32_decode_address
 
 from witnet.network.node import NodeClient
 from datetime import datetime
@@ -0,0 +1,159 @@
+import json
+import os
+import queue
+import threading
+from typing import Callable, Dict, List, NamedTuple, Optional, Union
+
+from witnet.crypto.hd_wallet.extended_private_key import Xprv
+from witnet.crypto.hd_wallet.extended_public_key import Xpub
+from witnet.util.json_rpc import format_node_request
+from witnet.util.socket_manager import SocketManager
+from witnet.witnet.address import pubkey_to_address
+from witnet.witnet.exceptions import UpstreamError
+
+# Number of consecutive unused addresses after which a keychain is considered exhausted (BIP44)
+GAP_LIMIT = 20
+
+# Addresses derived and queried per round
+SCAN_BATCH_SIZE = 20
+
+# Node connections (and threads) used to query UTXOs concurrently
+SCAN_CONNECTIONS = 4
+
+# External (receiving) and internal (change) keychains of an account, m/3h/4919h/0h/<keychain>/<index>
+KEYCHAINS = (0, 1)
+
+
+class DiscoveredAddress(NamedTuple):
+    keychain: int
+    index: int
+    address: str
+    utxos: list
+
+
+class NodeConnection:
+    """A single socket to a node, unlike `NodeClient` which is a process-wide singleton"""
+
+    def __init__(self, ip='127.0.0.1', port=21338):
+        self.socket_manager = SocketManager(ip=ip, port=port, internal=True)
+        self.socket_manager.connect()
+
+    def get_utxo_info(self, address: str) -> list:
+        response = self.socket_manager.query(request=format_node_request(method='getUtxoInfo', params=[address]))
+        if not isinstance(response, dict) or 'error' in response:
+            raise UpstreamError(f'getUtxoInfo failed for {address}: {response}')
+        return response['utxos']
+
+    def close(self):
+        self.socket_manager.disconnect()
+
+
+class AddressScanner:
+    """
+    Find the used addresses of an account (an Xprv or Xpub at depth 3, m/3h/4919h/0h).
+
+    Each keychain is derived `batch_size` addresses at a time (`ExtendedKey.children`), the UTXOs of a batch are
+    queried concurrently over a pool of `connections` node connections, and the scan of a keychain stops once
+    `gap_limit` consecutive addresses are unused. With a `state_file` the frontier of every keychain is saved as
+    JSON after each batch, and later scans only re-check the addresses after the last used one.
+    """
+
+    def __init__(self, account: Union[Xprv, Xpub], gap_limit=GAP_LIMIT, batch_size=SCAN_BATCH_SIZE,
+                 connections=SCAN_CONNECTIONS, ip='127.0.0.1', port=21338, state_file: Optional[str] = None,
+                 connect: Optional[Callable[[], NodeConnection]] = None):
+        assert gap_limit > 0 and batch_size > 0 and connections > 0
+        self.account = account
+        self.gap_limit = gap_limit
+        self.batch_size = batch_size
+        self.connections = connections
+        self.state_file = state_file
+        self.connect = connect or (lambda: NodeConnection(ip=ip, port=port))
+        self.state = self.load_state()
+        self._pool = queue.Queue()
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    def load_state(self) -> Dict[str, dict]:
+        """{keychain: {'last_used': index, 'used': {index: address}}}, empty when there is no saved scan"""
+        if self.state_file is None or not os.path.exists(self.state_file):
+            return {}
+        with open(self.state_file) as f:
+            state = json.load(f)
+        assert state.get('account') == self.account.public_keydata().hex(), \
+            f'{self.state_file} belongs to a different account'
+        return state['keychains']
+
+    def save_state(self):
+        if self.state_file is None:
+            return
+        tmp = f'{self.state_file}.tmp'
+        with open(tmp, 'w') as f:
+            json.dump({'account': self.account.public_keydata().hex(), 'keychains': self.state}, f, indent=2)
+        os.replace(tmp, self.state_file)
+
+    def scan(self, keychains=KEYCHAINS) -> List[DiscoveredAddress]:
+        """
+        Scan the keychains and return the addresses found with UTXOs, addresses before the saved frontier are not
+        queried again (see `used_addresses`)
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        found = []
+        try:
+            with ThreadPoolExecutor(max_workers=self.connections) as executor:
+                for keychain in keychains:
+                    found += self.scan_keychain(keychain, executor)
+        finally:
+            self.close()
+        return found
+
+    def scan_keychain(self, keychain: int, executor) -> List[DiscoveredAddress]:
+        parent = self.account / keychain
+        state = self.state.setdefault(str(keychain), {'last_used': -1, 'used': {}})
+        found = []
+        start = state['last_used'] + 1
+        while start - state['last_used'] - 1 < self.gap_limit:
+            children = parent.children(range(start, start + self.batch_size))
+            addresses = [pubkey_to_address(child.public_key()) for child in children]
+            for child, address, utxos in zip(children, addresses, executor.map(self.get_utxo_info, addresses)):
+                # past the gap, so the rest of the batch is ignored and the result does not depend on batch_size
+                if child.i - state['last_used'] > self.gap_limit:
+                    break
+                if utxos:
+                    state['last_used'] = max(state['last_used'], child.i)
+                    state['used'][str(child.i)] = address
+                    found.append(DiscoveredAddress(keychain, child.i, address, utxos))
+            start += self.batch_size
+            self.save_state()
+        return found
+
+    def used_addresses(self, keychain: int) -> Dict[int, str]:
+        """Addresses found with UTXOs by this or any earlier scan of the same state file"""
+        return {int(i): address for i, address in self.state.get(str(keychain), {}).get('used', {}).items()}
+
+    def get_utxo_info(self, address: str) -> list:
+        connection = self._acquire()
+        try:
+            return connection.get_utxo_info(address)
+        finally:
+            self._pool.put(connection)
+
+    def _acquire(self) -> NodeConnection:
+        """Take an idle connection, opening a new one while fewer than `connections` exist"""
+        with self._lock:
+            opening = self._pool.empty() and self._opened < self.connections
+            if opening:
+                self._opened += 1
+        if not opening:
+            return self._pool.get()
+        try:
+            return self.connect()
+        except Exception:
+            with self._lock:
+                self._opened -= 1
+            raise
+
+    def close(self):
+        while not self._pool.empty():
+            self._pool.get().close()
+        self._opened = 0